@@ -5,12 +5,19 @@ compare sha checksums (mostly because windows pwsh annoying) """
 
 import hashlib
 
+# read files in blocks this size rather than all at once
+CHUNK_SIZE = 1 << 20
+
+
 def checksum(filename, sha_file, alg='sha256'):
     """Verify a hash and raise error if fails"""
-    computed_hash = getattr(hashlib, alg)
-    computed_hash = hashlib.sha256()
     with open(filename, 'rb') as f:
-        computed_hash.update(f.read())
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+, reads in C
+            computed_hash = hashlib.file_digest(f, alg)
+        else:
+            computed_hash = hashlib.new(alg)
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                computed_hash.update(chunk)
     computed_hash = computed_hash.hexdigest()
     with open(sha_file) as f:
         hash_value = f.read().split()[0]
@@ -1,6 +1,6 @@
 import ast
 
-from numpy import array
+from numpy import array, asarray, rint
 from esprima import parseScript
 
 from psychopy.tools import monitorunittools
@@ -28,12 +28,18 @@ class TestWin:
             self.size = (1024, 768)
 
 def validDuration(t, hz, toleranceFrames=0.01):
-    """Test whether this is a possible time duration given the frame rate"""
+    """Test whether this is a possible time duration given the frame rate
+
+    `t` and `hz` may also be arrays, to test many durations in one call. A
+    boolean array is returned in that case.
+    """
     # best not to use mod operator for floats. e.g. 0.5%0.01 gives 0.00999
     # (due to a float round error?)
     # nFrames = t*hz so test if round(nFrames)==nFrames but with a tolerance
-    nFrames = float(t) * hz  # t might not be float if given as "0.5"?
-    return abs(nFrames - round(nFrames)) < toleranceFrames
+    nFrames = asarray(t, dtype=float) * hz  # t might be given as "0.5"
+    valid = abs(nFrames - rint(nFrames)) < toleranceFrames
+
+    return bool(valid) if valid.ndim == 0 else valid
 
 
 def convertParamToPix(value, win, units):
@@ -3,6 +3,8 @@ import webbrowser
 import wx
 import os
 import sys
+import shlex
+import threading
 import subprocess as sp
 from pypi_search import search as pypi
 
@@ -16,6 +18,63 @@ from psychopy.tools.pkgtools import (
 from psychopy.tools.versionchooser import parseVersionSafely
 
 
+def _splitCommand(cmd):
+    """Split a command line typed into the PIP terminal into arguments, the way
+    the shell would have.
+
+    On Windows this follows the rules `subprocess.list2cmdline` quotes for, so
+    double quotes group words (eg. `--target "C:\\My Dir"`) without being part
+    of the arguments and backslashes in paths are kept.
+
+    Raises
+    ------
+    ValueError
+        If a quotation is not closed.
+
+    """
+    if sys.platform != 'win32':
+        return shlex.split(cmd)
+
+    args = []
+    arg = []
+    inArg = inQuotes = False
+    nBackslashes = 0
+    for char in cmd:
+        if char == '\\':
+            nBackslashes += 1
+            inArg = True
+            continue
+        if char == '"':
+            # an even number of backslashes before a quote are escaped
+            # backslashes, an odd number escapes the quote too
+            arg.append('\\' * (nBackslashes // 2))
+            if nBackslashes % 2:
+                arg.append('"')
+            else:
+                inQuotes = not inQuotes
+            nBackslashes = 0
+            inArg = True
+            continue
+        arg.append('\\' * nBackslashes)
+        nBackslashes = 0
+        if char in ' \t' and not inQuotes:
+            if inArg:
+                args.append(''.join(arg))
+            arg = []
+            inArg = False
+        else:
+            arg.append(char)
+            inArg = True
+
+    if inQuotes:
+        raise ValueError("No closing quotation")
+    arg.append('\\' * nBackslashes)
+    if inArg:
+        args.append(''.join(arg))
+
+    return args
+
+
 class PackageManagerPanel(wx.Panel):
     def __init__(self, parent, dlg):
         wx.Panel.__init__(self, parent)
@@ -93,6 +152,9 @@ class PIPTerminalPanel(wx.Panel):
         self.Center()
 
     def onEnter(self, evt=None):
+        # Ignore commands entered while one is still running
+        if not self.console.IsEnabled():
+            return
         # Get current command
         cmd = self.console.GetValue()
         # Clear text entry
@@ -105,25 +167,26 @@ class PIPTerminalPanel(wx.Panel):
 
         env = os.environ.copy()
 
-        emts = [self.preface, cmd]
-        output = sp.Popen(' '.join(emts),
-                          stdout=sp.PIPE,
-                          stderr=sp.PIPE,
-                          shell=True,
-                          env=env,
-                          universal_newlines=True)
-        stdout, stderr = output.communicate()
-        sys.stdout.write(stdout)
-        sys.stderr.write(stderr)
-
         # Display input
         self.output.AppendText("\n>> " + cmd + "\n")
 
-        # Display output if error
-        if output.returncode != 0:
-            self.output.AppendText(stderr)
-
-        self.output.AppendText(stdout)
+        # pass arguments directly rather than through a shell, the preface is
+        # only quoted for display
+        try:
+            args = [sys.executable, "-m"] + _splitCommand(cmd)
+        except ValueError as err:  # eg. unbalanced quotes
+            self.output.AppendText(str(err) + "\n")
+            args = None
+
+        if args is not None:
+            # don't take another command until this one is done, the GUI main
+            # loop still runs while waiting for output
+            self.console.Disable()
+            try:
+                self._streamCommand(args, env)
+            finally:
+                self.console.Enable()
+                self.console.SetFocus()
 
         # Update output ctrl to style new text
         handlers.ThemeMixin._applyAppTheme(self.output)
@@ -131,6 +194,37 @@ class PIPTerminalPanel(wx.Panel):
         # Scroll to bottom
         self.output.ShowPosition(self.output.GetLastPosition())
 
+    def _streamCommand(self, args, env):
+        """Run a command, showing its output as it arrives."""
+        output = sp.Popen(args,
+                          stdout=sp.PIPE,
+                          stderr=sp.PIPE,
+                          env=env,
+                          bufsize=1,
+                          universal_newlines=True)
+
+        # collect errors in the background so neither pipe can fill up and
+        # stall the process
+        stderrLines = []
+        stderrThread = threading.Thread(
+            target=lambda: stderrLines.extend(output.stderr), daemon=True)
+        stderrThread.start()
+
+        # show output as it arrives rather than once the process exits
+        for line in iter(output.stdout.readline, ''):
+            sys.stdout.write(line)
+            self.output.AppendText(line)
+            wx.Yield()  # yield to the GUI main loop
+
+        output.wait()
+        stderrThread.join()
+        stderr = ''.join(stderrLines)
+        sys.stderr.write(stderr)
+
+        # Display output if error
+        if output.returncode != 0:
+            self.output.AppendText(stderr)
+
     def _applyAppTheme(self):
         # Style output ctrl
         handlers.ThemeMixin._applyAppTheme(self.output)
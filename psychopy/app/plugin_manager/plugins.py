@@ -20,6 +20,11 @@ import sys
 import json
 import glob
 
+try:
+    import orjson  # faster parsing of the plugin database, if available
+except ImportError:
+    orjson = None
+
 
 class AuthorInfo:
     """Plugin author information.
@@ -202,10 +207,10 @@ class PluginInfo:
         plugins.startUpPlugins(self.pipname, add=True, verify=False)
 
     def deactivate(self, evt=None):
-        # Remove from list of startup plugins
-        current = plugins.listPlugins(which='startup')
-        if self.pipname in current:
-            current.remove(self.pipname)
+        # Remove from list of startup plugins in a single pass
+        current = [
+            name for name in plugins.listPlugins(which='startup')
+            if name != self.pipname]
         plugins.startUpPlugins(current, add=False, verify=False)
 
     def install(self):
@@ -498,10 +503,14 @@ class PluginBrowserList(scrolledpanel.ScrolledPanel, handlers.ThemeMixin):
         # Setup items
         self.items = []
         self.populate()
-        # Store state of plugins on init so we can detect changes later
+        # Store state of plugins on init so we can detect changes later, using
+        # a single snapshot of the startup plugins rather than one per item
+        startUpPlugins = set(plugins.listPlugins(which='startup'))
         self.initState = {}
         for item in self.items:
-            self.initState[item.info.pipname] = {"installed": item.info.installed, "active": item.info.active}
+            self.initState[item.info.pipname] = {
+                "installed": item.info.installed,
+                "active": item.info.pipname in startUpPlugins}
 
     def populate(self):
         # get all plugin details
@@ -540,6 +549,8 @@ class PluginBrowserList(scrolledpanel.ScrolledPanel, handlers.ThemeMixin):
         Check what plugins have changed state (installed, active) since this dialog was opened
         """
         changes = {}
+        # snapshot the startup plugins once rather than once per item
+        startUpPlugins = set(plugins.listPlugins(which='startup'))
         for item in self.items:
             info = item.info
             # Skip if its init state wasn't stored
@@ -547,19 +558,22 @@ class PluginBrowserList(scrolledpanel.ScrolledPanel, handlers.ThemeMixin):
                 continue
             # Get inits
             inits = self.initState[info.pipname]
+            # Get current state, only looking each up once
+            active = info.pipname in startUpPlugins
+            installed = info.installed
 
             itemChanges = []
             # Has it been activated?
-            if info.active and not inits['active']:
+            if active and not inits['active']:
                 itemChanges.append("activated")
             # Has it been deactivated?
-            if inits['active'] and not info.active:
+            if inits['active'] and not active:
                 itemChanges.append("deactivated")
             # Has it been installed?
-            if info.installed and not inits['installed']:
+            if installed and not inits['installed']:
                 itemChanges.append("installed")
             # Has it been uninstalled?
-            if inits['installed'] and not info.installed:
+            if inits['installed'] and not installed:
                 itemChanges.append("uninstalled")
 
             # Add changes if there are any
@@ -1191,15 +1205,48 @@ def getAllPluginDetails():
 
     # where the database is expected to be
     pluginDatabaseFile = Path(appPluginCacheDir) / "plugins.json"
+    # validators (`ETag` and `Last-Modified`) sent with the cached database
+    pluginHeadersFile = Path(appPluginCacheDir) / "plugins.headers.json"
+    # validators from the last response, written out with the database
+    responseHeaders = {}
+
+    def parsePluginDatabase(value):
+        """Parse the plugin database from JSON text or bytes, using `orjson`
+        if it is installed.
+
+        """
+        if orjson is not None:
+            return orjson.loads(value)
+
+        return json.loads(value)
 
-    def downloadPluginDatabase(srcURL="https://psychopy.org/plugins.json"):
+    def readCacheHeaders(srcFile):
+        """Read the validators stored alongside the local plugin database.
+        Returns an empty dict if there are none.
+
+        """
+        if not srcFile.is_file():
+            return {}
+        try:
+            with srcFile.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.decoder.JSONDecodeError):
+            return {}
+
+    def downloadPluginDatabase(srcURL="https://psychopy.org/plugins.json",
+                               haveLocal=False):
         """Downloads the plugin database from the server and returns the text
-        as a string. If the download fails, returns None.
+        as a string. If the download fails or the server reports the local
+        copy is up to date, returns None.
 
         Parameters
         ----------
         srcURL : str
             The URL to download the plugin database from.
+        haveLocal : bool
+            Whether a readable local copy of the database exists. Validators
+            for it are only sent if so, otherwise the server could keep
+            reporting a missing or corrupt copy as up to date.
 
         Returns
         -------
@@ -1211,12 +1258,23 @@ def getAllPluginDetails():
         # if plugins already up to date, skip
         if not redownloadPlugins:
             return None
+        # ask the server to only send the database if it has changed
+        cached = readCacheHeaders(pluginHeadersFile) if haveLocal else {}
+        reqHeaders = {}
+        if cached.get('ETag'):
+            reqHeaders['If-None-Match'] = cached['ETag']
+        if cached.get('Last-Modified'):
+            reqHeaders['If-Modified-Since'] = cached['Last-Modified']
         # download database from website
         try:
-            resp = requests.get(srcURL)
-        except requests.exceptions.ConnectionError:
+            resp = requests.get(srcURL, headers=reqHeaders, timeout=5)
+        except requests.exceptions.RequestException:
             # if connection to website fails, return nothing
             return None
+        # local copy is current, use it
+        if resp.status_code == 304:
+            redownloadPlugins = False
+            return None
         # if download failed, return nothing
         if resp.status_code == 404:
             return None
@@ -1231,12 +1289,16 @@ def getAllPluginDetails():
 
         # attempt to parse JSON
         try:
-            database = json.loads(value)
-        except json.decoder.JSONDecodeError:
+            database = parsePluginDatabase(value)
+        except ValueError:
             # if JSON parse fails, return nothing
             return None
         # if we made it this far, mark plugins as not needing update
         redownloadPlugins = False
+        # keep validators so the next check can be answered with a 304
+        for key in ('ETag', 'Last-Modified'):
+            if resp.headers.get(key):
+                responseHeaders[key] = resp.headers[key]
 
         return database
         
@@ -1261,14 +1323,14 @@ def getAllPluginDetails():
         # attempt to parse JSON
         try:
             with srcFile.open("r", encoding="utf-8", errors="ignore") as f:
-                return json.load(f)
-        except json.decoder.JSONDecodeError:
+                return parsePluginDatabase(f.read())
+        except ValueError:
             # if JSON parse fails, return nothing
             return None
     
     def deletePluginDlgCache():
         """Delete the local plugin database file and cached files related to 
-        the Plugin dialog.
+        the Plugin dialog, including the validators stored for the database.
         """
         if os.path.exists(appPluginCacheDir):
             files = glob.glob(os.path.join(appPluginCacheDir, '*'))
@@ -1278,20 +1340,33 @@ def getAllPluginDetails():
     # get a copy of the plugin database from the server, check if it's newer
     # than the local copy, and if so, replace the local copy
 
-    # get remote database
-    serverPluginDatabase = downloadPluginDatabase()
     # get local database
     localPluginDatabase = readLocalPluginDatabase(pluginDatabaseFile)
+    # get remote database, only asking if it has changed if the local copy is
+    # readable
+    serverPluginDatabase = downloadPluginDatabase(
+        haveLocal=localPluginDatabase is not None)
 
     if serverPluginDatabase is not None:
         # if we have a database from the remote, use it
         pluginDatabase = serverPluginDatabase
         # if the file contents has changed, delete cached icons and etc.
+        savedDatabase = True
         if str(pluginDatabase) != str(localPluginDatabase):
             deletePluginDlgCache()
             # write new contents to file
-            with pluginDatabaseFile.open("w", encoding='utf-8') as f:
-                json.dump(pluginDatabase, f, indent=True)
+            try:
+                with pluginDatabaseFile.open("w", encoding='utf-8') as f:
+                    json.dump(pluginDatabase, f, indent=True)
+            except OSError:
+                savedDatabase = False
+        # store validators only for a copy which made it to disk
+        if savedDatabase:
+            try:
+                with pluginHeadersFile.open("w", encoding='utf-8') as f:
+                    json.dump(responseHeaders, f)
+            except OSError:
+                pass
 
     elif localPluginDatabase is not None:
         # otherwise use cached
@@ -1312,26 +1387,28 @@ def getAllPluginDetails():
         objs.append(PluginInfo(**info))
 
     # Add info objects for local plugins which aren't found online
+    remoteNames = {obj.pipname for obj in objs}
     localPlugins = plugins.listPlugins(which='all')
     for name in localPlugins:
-        # Check whether plugin is accounted for
-        if name not in objs:
-            # If not, get its metadata
-            data = plugins.pluginMetadata(name)
-            # Create best representation we can from metadata
-            author = AuthorInfo(
-                name=data.get('Author', ''),
-                email=data.get('Author-email', ''),
-            )
-            info = PluginInfo(
-                pipname=name, name=name,
-                author=author,
-                homepage=data.get('Home-page', ''),
-                keywords=data.get('Keywords', ''),
-                description=data.get('Summary', ''),
-            )
-            # Add to list
-            objs.append(info)
+        # Skip plugins accounted for, without reading their metadata
+        if name in remoteNames:
+            continue
+        # If not, get its metadata
+        data = plugins.pluginMetadata(name)
+        # Create best representation we can from metadata
+        author = AuthorInfo(
+            name=data.get('Author', ''),
+            email=data.get('Author-email', ''),
+        )
+        info = PluginInfo(
+            pipname=name, name=name,
+            author=author,
+            homepage=data.get('Home-page', ''),
+            keywords=data.get('Keywords', ''),
+            description=data.get('Summary', ''),
+        )
+        # Add to list
+        objs.append(info)
 
     _pluginObjects = objs  # cache for later
 
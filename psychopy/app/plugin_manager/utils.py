@@ -19,6 +19,9 @@ class InstallErrorDlg(wx.Dialog, handlers.ThemeMixin):
             title=caption,
             style=wx.RESIZE_BORDER | wx.CLOSE_BOX | wx.CAPTION
         )
+        # look up fonts once, the code font is used twice
+        titleFont = fonts.appTheme['h3'].obj
+        codeFont = fonts.appTheme['code'].obj
         # Setup sizer
         self.border = wx.BoxSizer(wx.VERTICAL)
         self.SetSizer(self.border)
@@ -26,31 +29,36 @@ class InstallErrorDlg(wx.Dialog, handlers.ThemeMixin):
         self.border.Add(self.sizer, proportion=1, border=6, flag=wx.ALL | wx.EXPAND)
         # Create title sizer
         self.title = wx.BoxSizer(wx.HORIZONTAL)
-        self.sizer.Add(self.title, border=6, flag=wx.ALL | wx.EXPAND)
         # Create icon
         self.icon = wx.StaticBitmap(
             self, size=(32, 32),
             bitmap=icons.ButtonIcon(stem="stop", size=32).bitmap
         )
-        self.title.Add(self.icon, border=6, flag=wx.ALL | wx.EXPAND)
         # Create title
         self.titleLbl = wx.StaticText(self, label=label)
-        self.titleLbl.SetFont(fonts.appTheme['h3'].obj)
-        self.title.Add(self.titleLbl, proportion=1, border=6, flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL)
+        self.titleLbl.SetFont(titleFont)
+        self.title.AddMany([
+            (self.icon, 0, wx.ALL | wx.EXPAND, 6),
+            (self.titleLbl, 1, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 6),
+        ])
         # Show what we tried
         self.inLbl = wx.StaticText(self, label=_translate("We tried:"))
-        self.sizer.Add(self.inLbl, border=6, flag=wx.ALL | wx.EXPAND)
         self.inCtrl = wx.TextCtrl(self, value=cmd, style=wx.TE_READONLY)
         self.inCtrl.SetBackgroundColour("white")
-        self.inCtrl.SetFont(fonts.appTheme['code'].obj)
-        self.sizer.Add(self.inCtrl, border=6, flag=wx.ALL | wx.EXPAND)
+        self.inCtrl.SetFont(codeFont)
         # Show what we got
         self.outLbl = wx.StaticText(self, label=_translate("We got:"))
-        self.sizer.Add(self.outLbl, border=6, flag=wx.ALL | wx.EXPAND)
         self.outCtrl = wx.TextCtrl(self, value=f"{stdout}\n{stderr}",
                                    size=(-1, 620), style=wx.TE_READONLY | wx.TE_MULTILINE)
-        self.outCtrl.SetFont(fonts.appTheme['code'].obj)
-        self.sizer.Add(self.outCtrl, proportion=1, border=6, flag=wx.ALL | wx.EXPAND)
+        self.outCtrl.SetFont(codeFont)
+        # Add everything to the sizer in one go
+        self.sizer.AddMany([
+            (self.title, 0, wx.ALL | wx.EXPAND, 6),
+            (self.inLbl, 0, wx.ALL | wx.EXPAND, 6),
+            (self.inCtrl, 0, wx.ALL | wx.EXPAND, 6),
+            (self.outLbl, 0, wx.ALL | wx.EXPAND, 6),
+            (self.outCtrl, 1, wx.ALL | wx.EXPAND, 6),
+        ])
 
         # Make buttons
         self.btns = self.CreateStdDialogButtonSizer(flags=wx.OK)
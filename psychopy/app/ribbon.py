@@ -69,16 +69,11 @@ class FrameRibbon(wx.Panel, handlers.ThemeMixin):
         list[FrameRubbinPluginSection]
             List of section objects which were added
         """
-        from importlib import metadata
-        # start off with no entry points or sections
-        entryPoints = []
+        from psychopy.plugins import getEntryPointGroup
+        # start off with no sections
         sections = []
-        # iterate through all entry point groups
-        for thisGroup, eps in metadata.entry_points().items():
-            # get entry points for matching group
-            if thisGroup == group:
-                # add to list of all entry points
-                entryPoints += eps
+        # get entry points for matching group
+        entryPoints = getEntryPointGroup(group)
         # iterate through found entry points
         for ep in entryPoints:
             try:
@@ -238,25 +238,32 @@ def getComponents(folder=None, fetchIcons=True):
         # give a default category
         if not hasattr(module, 'categories'):
             module.categories = ['Custom']
-        # check if module contains a component
-        for attrib in dir(module):
-            name = None
+        # check if module contains a component, collecting tooltips and icons
+        # to register them all at once
+        hasTooltip = hasattr(module, 'tooltip')
+        newTooltips = {}
+        newIconFiles = {}
+        for attrib, thisComp in sorted(vars(module).items()):
             # fetch the attribs that end with 'Component'
-            if attrib.endswith('omponent') and attrib not in excludeComponents:
-                name = attrib
-                components[attrib] = getattr(module, attrib)
-
-                # skip if this class was imported, not defined here
-                if module.__name__ != components[attrib].__module__:
-                    continue  # class was defined in different module
-
-                if hasattr(module, 'tooltip'):
-                    tooltips[name] = module.tooltip
-                if hasattr(components[attrib], 'iconFile'):
-                    iconFiles[name] = components[attrib].iconFile
-                # assign the module categories to the Component
-                if not hasattr(components[attrib], 'categories'):
-                    components[attrib].categories = ['Custom']
+            if not attrib.endswith('Component') or attrib in excludeComponents:
+                continue
+
+            components[attrib] = thisComp
+
+            # skip if this class was imported, not defined here
+            if module.__name__ != thisComp.__module__:
+                continue  # class was defined in different module
+
+            if hasTooltip:
+                newTooltips[attrib] = module.tooltip
+            if hasattr(thisComp, 'iconFile'):
+                newIconFiles[attrib] = thisComp.iconFile
+            # assign the module categories to the Component
+            if not hasattr(thisComp, 'categories'):
+                thisComp.categories = ['Custom']
+
+        tooltips.update(newTooltips)
+        iconFiles.update(newIconFiles)
 
     return components
 
@@ -10,6 +10,7 @@ import warnings
 import numpy
 import numbers  # numbers.Integral is like (int, long) but supports Py3
 import datetime
+import functools
 from ..errors import print2err, printExceptionDetailsToStdErr
 import re
 import collections.abc
@@ -36,62 +37,160 @@ except ImportError:
 from psychopy.preferences import prefs
 
 
+# types that never need copying; checked by exact type for speed
+_immutableConfigTypes = frozenset((str, int, float, bool, type(None), bytes))
+
+
+def _fastCopy(obj):
+    '''
+    Returns a deep copy of obj, which is expected to be config data as loaded
+    from YAML. dicts, lists and tuples are copied directly, which is much
+    faster than copy.deepcopy; any other mutable type falls back to
+    copy.deepcopy.
+    '''
+    otype = type(obj)
+    if otype is dict:
+        return {k: _fastCopy(v) for k, v in obj.items()}
+    if otype is list:
+        return [_fastCopy(v) for v in obj]
+    if otype is tuple:
+        return tuple([_fastCopy(v) for v in obj])
+    if otype in _immutableConfigTypes:
+        return obj
+    return copy.deepcopy(obj)
+
+
+def _readBytes(path):
+    '''
+    Returns the contents of the file at path as bytes. The buffer is sized
+    from the file size, so a regular file is usually read with a single read
+    call rather than the several small reads a buffered file object makes.
+    '''
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        bufsize = os.fstat(fd).st_size + 1
+        chunks = []
+        while True:
+            chunk = os.read(fd, bufsize)
+            if not chunk:  # reads may be short, only b'' means end of file
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+
 def saveConfig(config, dst_path):
     '''
     Saves a config dict to dst_path in YAML format.
     '''
-    ydump(config, open(dst_path, 'w'), Dumper=yDumper)
+    with open(dst_path, 'wb') as f:
+        ydump(config, f, Dumper=yDumper, encoding='utf-8')
     return os.path.exists(dst_path)
 
 
+# Parsed YAML files, keyed by real path. Values are (mtime_ns, size, config)
+# tuples; an entry is only reused if the file has not changed on disk since it
+# was parsed. Least recently used entries are dropped once the cache is full.
+_readConfigCache = collections.OrderedDict()
+_readConfigCacheSize = 100
+
+
 def readConfig(scr_path):
     '''
     Returns the config dict loaded from scr_path, which must be the path to
     a YAML file.
+
+    Parsed files are cached and reused until their modification time or size
+    changes. A copy of the cached config is returned, so callers are free to
+    modify it.
     '''
-    return yload(open(scr_path, 'r'), Loader=yLoader)
+    cache_key = os.path.realpath(scr_path)
+    fstat = os.stat(cache_key)
+    cached = _readConfigCache.get(cache_key)
+    if cached is not None and cached[:2] == (fstat.st_mtime_ns, fstat.st_size):
+        _readConfigCache.move_to_end(cache_key)
+        return _fastCopy(cached[2])
+
+    config = yload(_readBytes(cache_key), Loader=yLoader)
+
+    _readConfigCache[cache_key] = (fstat.st_mtime_ns, fstat.st_size, config)
+    _readConfigCache.move_to_end(cache_key)
+    if len(_readConfigCache) > _readConfigCacheSize:
+        _readConfigCache.popitem(last=False)
+
+    return _fastCopy(config)
+
+
+# Matches an unquoted top level YAML mapping key with no inline value,
+# e.g. 'eyetracker.hw.mouse.EyeTracker:'
+_yamlRootKeyRe = re.compile(r'^([A-Za-z_][\w.]*):\s*(#.*)?$')
+
+
+def _readConfigRootKey(scr_path):
+    '''
+    Returns the first top level key of the YAML file at scr_path, reading only
+    the start of the file. Falls back to parsing the whole file with readConfig
+    if the key can not be read from the raw text.
+    '''
+    with open(scr_path, 'r') as f:
+        for line in f:
+            sline = line.strip()
+            if not sline or sline.startswith('#') or sline == '---':
+                continue
+            match = _yamlRootKeyRe.match(line.rstrip())
+            if match:
+                return match.group(1)
+            break
+    return list(readConfig(scr_path).keys())[0]
 
 
 def mergeConfigurationFiles(base_config_file_path, update_from_config_file_path, merged_save_to_path):
     """Merges two iohub configuration files into one and saves it to a file
     using the path/file name in merged_save_to_path."""
-    base_config = yload(open(base_config_file_path, 'r'), Loader=yLoader)
+    base_config = yload(_readBytes(base_config_file_path), Loader=yLoader)
     update_from_config = yload(
-        open(
-            update_from_config_file_path,
-            'r'),
-        Loader=yLoader)
-
-    def merge(update, base):
-        if isinstance(update, dict) and isinstance(base, dict):
+        _readBytes(update_from_config_file_path), Loader=yLoader)
+
+    # walk both configs with an explicit stack, updating dicts in place;
+    # base values are taken as-is since base_config was parsed just above
+    merged = _fastCopy(update_from_config)
+    if isinstance(merged, dict) and isinstance(base_config, dict):
+        stack = [(merged, base_config)]
+        while stack:
+            update, base = stack.pop()
             for k, v in base.items():
                 if k not in update:
                     update[k] = v
-                else:
-                    if isinstance(update[k], list):
-                        if isinstance(v, list):
-                            v.extend(update[k])
-                            update[k] = v
-                        else:
-                            update[k].insert(0, v)
+                    continue
+                uv = update[k]
+                if isinstance(uv, list):
+                    if isinstance(v, list):
+                        update[k] = v + uv
                     else:
-                        update[k] = merge(update[k], v)
-        return update
+                        uv.insert(0, v)
+                elif isinstance(uv, dict) and isinstance(v, dict):
+                    stack.append((uv, v))
 
-    merged = merge(copy.deepcopy(update_from_config), base_config)
-    ydump(merged, open(merged_save_to_path, 'w'), Dumper=yDumper)
+    with open(merged_save_to_path, 'wb') as f:
+        ydump(merged, f, Dumper=yDumper, encoding='utf-8')
 
     return merged
 
 ########################
 
 
+# os.path.normcase only changes paths on Windows; skip it everywhere else.
+_normcase = os.path.normcase if sys.platform == 'win32' else (lambda s: s)
+_normpath = os.path.normpath
+
+
 def normjoin(*path_parts):
     """
     normjoin combines the following Python os.path functions in the following
     call order:
         * join
-        * normcase
+        * normcase (Windows only, it has no effect on other platforms)
         * normpath
 
     Args:
@@ -100,7 +199,11 @@ def normjoin(*path_parts):
     Returns:
 
     """
-    return os.path.normpath(os.path.normcase(os.path.join(*path_parts)))
+    return _normpath(_normcase(os.path.join(*path_parts)))
+
+
+# name of the folder holding binaries built for the running Python version
+_pythonVersionFolder = f'python{sys.version_info[0]}{sys.version_info[1]}'
 
 
 def addDirectoryToPythonPath(path_from_iohub_root, leaf_folder=''):
@@ -109,10 +212,7 @@ def addDirectoryToPythonPath(path_from_iohub_root, leaf_folder=''):
         IOHUB_DIRECTORY,
         path_from_iohub_root,
         sys.platform,
-        'python{0}{1}'.format(
-            *
-            sys.version_info[
-                0:2]),
+        _pythonVersionFolder,
         leaf_folder)
     if os.path.isdir(dir_path) and dir_path not in sys.path:
         sys.path.append(dir_path)
@@ -191,6 +291,52 @@ def isIterable(o):
     return isinstance(o, Iterable)
 
 
+# modification time of the packages directory when `_deviceSearchTag` last
+# refreshed the plugin bundle paths
+_bundlesMTime = object()
+
+
+def _deviceSearchTag():
+    """Return a value which changes when device modules may have been added,
+    ie. when plugin bundles are installed or plugins are loaded.
+
+    """
+    global _bundlesMTime
+    try:
+        packagesMTime = os.stat(prefs.paths['packages']).st_mtime_ns
+    except OSError:
+        packagesMTime = None
+
+    # only look for newly installed bundles if the packages directory changed,
+    # finding them is slow
+    if packagesMTime != _bundlesMTime:
+        plugins.refreshBundlePaths()  # adds new bundles to `sys.path`
+        _bundlesMTime = packagesMTime
+
+    return (tuple(sys.path), packagesMTime,
+            tuple(sorted(plugins.listPlugins('loaded'))))
+
+
+def _memoizeDeviceQuery(func):
+    """Decorator caching the result of a device config query. Results are
+    reused until plugins are installed or loaded (see `_deviceSearchTag`), as
+    they may provide more devices. Callers get a deep copy of the cached
+    result, so they may modify it freely. Call `func.cache_clear()` to force a
+    rescan.
+
+    """
+    @functools.lru_cache(maxsize=64)
+    def cachedFunc(searchTag, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return _fastCopy(cachedFunc(_deviceSearchTag(), *args, **kwargs))
+
+    wrapper.cache_clear = cachedFunc.cache_clear
+    return wrapper
+
+
 # Get available device module paths
 def getDevicePaths(device_name=""):
     """Get the paths to the iohub device modules that are available.
@@ -232,24 +378,49 @@ def getDevicePaths(device_name=""):
         """
         yaml_paths = []
         # try to walk both the internal iohub_device_path and user-level packages folder
-        for route in (os.walk(iohub_device_path), os.walk(prefs.paths['packages'])):
-            for root, _, files in route:
-                # check each file in the route to see if it's a config yaml
-                device_folder = None
-                for file in files:
-                    if file == 'supported_config_settings.yaml':
-                        device_folder = root
-                        break
-                if device_folder:
-                    for dfile in files:
-                        if dfile.startswith("default_") and dfile.endswith('.yaml'):
-                            # if file is a new config yaml, append it
-                            item = (device_folder, dfile)
-                            if item not in yaml_paths:
-                                yaml_paths.append(item)
+        for route in (iohub_device_path, prefs.paths['packages']):
+            for item in _scanDeviceFolders(route):
+                if item not in yaml_paths:
+                    yaml_paths.append(item)
 
         return yaml_paths
 
+    def _scanDeviceFolders(root):
+        """Walk the directory tree under root (top-down, like `os.walk`),
+        yielding a (folder, file) tuple for each default config yaml found in a
+        folder that also holds a supported_config_settings.yaml. Device folders
+        can be nested (e.g. eyetracker/hw/mouse), so every subfolder is
+        visited.
+
+        """
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        is_device_folder = False
+        default_files = []
+        sub_dirs = []
+        # single pass over the folder; DirEntry caches the file type so
+        # no extra stat calls are needed
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                sub_dirs.append(entry.path)
+            elif entry.is_file():
+                fname = entry.name
+                if fname == 'supported_config_settings.yaml':
+                    is_device_folder = True
+                elif fname.startswith("default_") and fname.endswith('.yaml'):
+                    default_files.append(fname)
+
+        if is_device_folder:
+            for dfile in default_files:
+                yield root, dfile
+
+        for sub_dir in sub_dirs:
+            yield from _scanDeviceFolders(sub_dir)
+
     scs_yaml_paths = []  # stores the paths to the device config files
     plugins.refreshBundlePaths()  # make sure eyetracker external plugins are reachable
 
@@ -314,6 +485,50 @@ def getDevicePaths(device_name=""):
     return scs_yaml_paths
 
 
+def _loadAllDeviceFiles(device_name, folder_files=(), defaults=True):
+    """Load the config files of the devices found for device_name in a single
+    pass over the device folders.
+
+    Parameters
+    ----------
+    device_name : str
+        The name of the device to load the files for, as passed to
+        `getDevicePaths`.
+    folder_files : tuple
+        Names of files shared by the devices in a folder to read, eg.
+        supported_config_settings.yaml. Only these files are read.
+    defaults : bool
+        Also read the default config file of each device.
+
+    Returns
+    -------
+    list
+        A (default_config, folder_configs) tuple for each default config
+        file found. default_config is None if `defaults` is False.
+        folder_configs maps the name of each requested folder file to its
+        contents. Folder files are only read once per folder, even if the
+        folder holds several default configs.
+
+    """
+    if device_name.endswith(".EyeTracker"):
+        device_name = device_name[:-11]
+
+    folder_configs = {}
+    device_files = []
+    for dpath, dconf in getDevicePaths(device_name):
+        if dpath not in folder_configs:
+            # raises if a file is missing, like reading it directly would
+            folder_configs[dpath] = {
+                fname: readConfig(os.path.join(dpath, fname))
+                for fname in folder_files}
+        default_config = readConfig(
+            os.path.join(dpath, dconf)) if defaults else None
+        device_files.append((default_config, folder_configs[dpath]))
+
+    return device_files
+
+
+@_memoizeDeviceQuery
 def getDeviceDefaultConfig(device_name, builder_hides=True):
     """
     Return the default iohub config dictionary for the given device(s). The dictionary contains the
@@ -338,13 +553,9 @@ def getDeviceDefaultConfig(device_name, builder_hides=True):
          'save_events': True,
          'stream_events': True}
     """
-    if device_name.endswith(".EyeTracker"):
-        device_name = device_name[:-11]
-    device_paths = getDevicePaths(device_name)
-
     device_configs = []
-    for dpath, dconf in device_paths:
-        dname, dconf_dict = list(readConfig(os.path.join(dpath, dconf)).items())[0]
+    for default_config, _ in _loadAllDeviceFiles(device_name):
+        dname, dconf_dict = list(default_config.items())[0]
         if builder_hides:
             to_hide = dconf_dict.get('builder_hides', [])
             for param in to_hide:
@@ -386,36 +597,37 @@ def getDeviceNames(device_name="eyetracker.hw", get_paths=True):
          ('SR Research Ltd', 'eyetracker.hw.sr_research.eyelink.EyeTracker'),
          ('Tobii Technology', 'eyetracker.hw.tobii.EyeTracker')]
     """
+    if device_name.endswith(".EyeTracker"):
+        device_name = device_name[:-11]
+
     names = []
-    dconfigs = getDeviceDefaultConfig(device_name)
-    for dcfg in dconfigs:
-        d_path = tuple(dcfg.keys())[0]
-        d_config = tuple(dcfg.values())[0]
+    for dpath, dconf in getDevicePaths(device_name):
+        yaml_path = os.path.join(dpath, dconf)
         if get_paths is False:
-            names.append(d_path)
+            # only the device name is needed, so skip parsing the whole file
+            names.append(_readConfigRootKey(yaml_path))
         else:
+            d_path, d_config = list(readConfig(yaml_path).items())[0]
             names.append((d_config.get('manufacturer_name'), d_path))
     return names
 
 def getDeviceFile(device_name, file_name):
     """
-    Returns the contents of file_name for the specified device. If file_name does not exist, None is returned.
+    Returns the contents of file_name for the specified device.
 
     :param device_name: iohub device name
     :param: file_name: name of device yaml file to load
     :return: dict
     """
-    if device_name.endswith(".EyeTracker"):
-        device_name = device_name[:-11]
-    device_paths = getDevicePaths(device_name)
-    device_sconfigs = []
-    for dpath, _ in device_paths:
-        device_sconfigs.append(readConfig(os.path.join(dpath, file_name)))
+    device_sconfigs = [
+        folder_configs[file_name] for _, folder_configs in
+        _loadAllDeviceFiles(device_name, (file_name,), defaults=False)]
     if len(device_sconfigs) == 1:
         # simplify return value when only one device was requested
         return list(device_sconfigs[0].values())[0]
     return device_sconfigs
 
+@_memoizeDeviceQuery
 def getDeviceSupportedConfig(device_name):
     """
     Returns the contents of the supported_config_settings.yaml for the specified device.
@@ -537,14 +749,18 @@ def getObjectModuleAndClassName(obj, split=True):
 
 
 # Recursive updating of values from one dict into another if the key does not key exist.
-# Supported nested dicts and uses deep copy when setting values in the
+# Supported nested dicts and uses a deep copy when setting values in the
 # target dict.
 def updateDict(add_to, add_from):
-    for key, value in add_from.items():
-        if key not in add_to:
-            add_to[key] = copy.deepcopy(value)
-        elif isinstance(value, dict) and isinstance(add_to[key], dict):
-            updateDict(add_to[key], value)
+    # walk nested dicts with an explicit stack rather than recursion
+    stack = [(add_to, add_from)]
+    while stack:
+        add_to, add_from = stack.pop()
+        for key, value in add_from.items():
+            if key not in add_to:
+                add_to[key] = _fastCopy(value)
+            elif isinstance(value, dict) and isinstance(add_to[key], dict):
+                stack.append((add_to[key], value))
 
 
 def updateSettings(d, u):
@@ -565,6 +781,9 @@ first_cap_re = re.compile('(.)([A-Z][a-z]+)')
 all_cap_re = re.compile('([a-z0-9])([A-Z])')
 
 
+# Names come from a small fixed set (event and device class names), so the
+# results are cached.
+@functools.lru_cache(maxsize=1024)
 def convertCamelToSnake(name, lower_snake=True):
     s1 = first_cap_re.sub(r'\1_\2', name)
     if lower_snake:
@@ -601,17 +820,18 @@ def complement(r, g, b):
 
 class NumPyRingBuffer():
     """NumPyRingBuffer is a circular buffer implemented using a one dimensional
-    numpy array on the backend. The algorithm used to implement the ring buffer
-    behavior does not require any array copies to occur while the ring buffer
-    is maintained, while at the same time allowing sequential element access
-    into the numpy array using a subset of standard slice notation.
+    numpy array on the backend. Each element is stored once, in a numpy array
+    of max_size elements, and no array copies are needed while the ring buffer
+    is maintained. Sequential element access into the buffer is supported
+    using a subset of standard slice notation.
 
     When the circular buffer is created, a maximum size , or maximum
     number of elements,  that the buffer can hold *must* be specified. When
     the buffer becomes full, each element added to the buffer removes the oldest
     element from the buffer so that max_size is never exceeded.
 
-    Items are added to the ring buffer using the classes append method.
+    Items are added to the ring buffer using the classes append method, or
+    several at a time using the extend method.
 
     The current number of elements in the buffer can be retrieved using the
     getLength() method of the class.
@@ -625,8 +845,9 @@ class NumPyRingBuffer():
     element added to the buffer, and index n (which can be up to max_size-1)
     is the most recent element added to the buffer.
 
-    Methods that can be called from a standard numpy array can also be called using the
-    NumPyRingBuffer instance created. However Numpy module level functions will not accept
+    The common reductions (min, max, sum, mean, std and var) are methods of the
+    class. Other methods that can be called from a standard numpy array can also
+    be called using the NumPyRingBuffer instance created. However Numpy module level functions will not accept
     a NumPyRingBuffer as a valid argument.
 
     To clear the ring buffer and start with no data in the buffer, without
@@ -651,11 +872,14 @@ class NumPyRingBuffer():
 
     """
 
+    __slots__ = ('_dtype', '_npa', 'max_size', '_index', '_head')
+
     def __init__(self, max_size, dtype=numpy.float32):
         self._dtype = dtype
-        self._npa = numpy.empty(max_size * 2, dtype=dtype)
+        self._npa = numpy.empty(max_size, dtype=dtype)
         self.max_size = max_size
-        self._index = 0
+        self._index = 0  # total number of elements added since last clear()
+        self._head = 0  # position in _npa the next element is written to
 
     def append(self, element):
         """Add element e to the end of the RingBuffer. The element must match
@@ -669,26 +893,150 @@ class NumPyRingBuffer():
         :returns None:
 
         """
-        i = self._index
-        self._npa[i % self.max_size] = element
-        self._npa[(i % self.max_size) + self.max_size] = element
+        head = self._head
+        self._npa[head] = element
+        head += 1
+        self._head = 0 if head == self.max_size else head
         self._index += 1
 
+    def extend(self, elements):
+        """Add a sequence of elements to the end of the RingBuffer, in order.
+        This is equivalent to calling append() for each element, but the
+        elements are copied into the buffer using (at most two) numpy slice
+        assignments, so it is much faster when adding many elements at once.
+
+        If more than max_size elements are given, only the last max_size
+        elements are kept.
+
+        :param numpy.array elements: Array-like of elements to add to the RingBuffer.
+        :returns None:
+
+        """
+        elements = numpy.asarray(elements, dtype=self._dtype).ravel()
+        k = len(elements)
+        max_size = self.max_size
+        if k > max_size:
+            # the leading elements would be overwritten anyway
+            self._index += k - max_size
+            self._head = (self._head + k - max_size) % max_size
+            elements = elements[-max_size:]
+            k = max_size
+
+        start = self._head
+        n1 = min(k, max_size - start)  # elements written before wrapping
+        self._npa[start:start + n1] = elements[:n1]
+        if k > n1:
+            self._npa[:k - n1] = elements[n1:]
+        self._head = (start + k) % max_size
+        self._index += k
+
     def getElements(self):
-        """Return the numpy array being used by the RingBuffer, the length of
-        which will be equal to the number of elements added to the list, or the
-        last max_size elements added to the list. Elements are in order of
+        """Return a numpy array of the elements in the RingBuffer, the length
+        of which will be equal to the number of elements added to the list, or
+        the last max_size elements added to the list. Elements are in order of
         addition to the ring buffer.
 
+        Until the buffer wraps around, a view of the backing array is returned,
+        which later additions to the buffer may overwrite. After that, a new
+        array holding a copy of the elements is returned.
+
         :param None:
         :returns numpy.array: The array of data elements that make up the Ring Buffer.
 
         """
-        return self._npa[
-            self._index %
-            self.max_size:(
-                self._index %
-                self.max_size) + self.max_size]
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0]
+        return numpy.concatenate(segments)
+
+    def _segments(self):
+        # the elements in order, as one or two views into the backing array
+        start = self._head
+        if self._index <= self.max_size or start == 0:
+            return (self._npa[:min(self._index, self.max_size)],)
+        return self._npa[start:], self._npa[:start]
+
+    def min(self, *args, **kwargs):
+        """Return the minimum element value. Any arguments are passed to
+        numpy.ndarray.min().
+
+        """
+        if args or kwargs:
+            return self.getElements().min(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].min()
+        return numpy.minimum(segments[0].min(), segments[1].min())
+
+    def max(self, *args, **kwargs):
+        """Return the maximum element value. Any arguments are passed to
+        numpy.ndarray.max().
+
+        """
+        if args or kwargs:
+            return self.getElements().max(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].max()
+        return numpy.maximum(segments[0].max(), segments[1].max())
+
+    def sum(self, *args, **kwargs):
+        """Return the sum of the elements. Any arguments are passed to
+        numpy.ndarray.sum().
+
+        """
+        if args or kwargs:
+            return self.getElements().sum(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].sum()
+        return segments[0].sum() + segments[1].sum()
+
+    def mean(self, *args, **kwargs):
+        """Return the mean of the elements. Any arguments are passed to
+        numpy.ndarray.mean().
+
+        """
+        if args or kwargs:
+            return self.getElements().mean(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].mean()
+        return (segments[0].sum() + segments[1].sum()) / self.max_size
+
+    def std(self, *args, **kwargs):
+        """Return the standard deviation of the elements. Any arguments are
+        passed to numpy.ndarray.std().
+
+        """
+        if args or kwargs:
+            return self.getElements().std(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].std()
+        return numpy.sqrt(self._wrappedVar(segments))
+
+    def var(self, *args, **kwargs):
+        """Return the variance of the elements. Any arguments are passed to
+        numpy.ndarray.var().
+
+        """
+        if args or kwargs:
+            return self.getElements().var(*args, **kwargs)
+        segments = self._segments()
+        if len(segments) == 1:
+            return segments[0].var()
+        return self._wrappedVar(segments)
+
+    def _wrappedVar(self, segments):
+        # variance of a full buffer from the mean and variance of each of its
+        # two segments, so the elements don't need copying into one array
+        means = [seg.mean() for seg in segments]
+        mean = (means[0] * len(segments[0]) + means[1] * len(segments[1])) / \
+            self.max_size
+        return sum(
+            len(seg) * (seg.var() + (segMean - mean) ** 2)
+            for seg, segMean in zip(segments, means)) / self.max_size
 
     def isFull(self):
         """Indicates if the RingBuffer is at it's max_size yet.
@@ -708,64 +1056,23 @@ class NumPyRingBuffer():
 
         """
         self._index = 0
+        self._head = 0
+
+    def _bufferIndex(self, indexs):
+        # map an int or slice index into the ordered elements to the matching
+        # position(s) in the backing array
+        positions = numpy.arange(len(self))[indexs]
+        if self.isFull():
+            positions = (positions + self._head) % self.max_size
+        return positions
 
     def __setitem__(self, indexs, v):
         if isinstance(indexs, (list, tuple)):
             for i in indexs:
-                if isinstance(i, numbers.Integral):
-                    i = i + self._index
-                    self._npa[i % self.max_size] = v
-                    self._npa[(i % self.max_size) + self.max_size] = v
-                elif isinstance(i, slice):
-                    istart = indexs.start
-                    if istart is None:
-                        istart = 0
-                    istop = indexs.stop
-                    if indexs.stop is None:
-                        istop = 0
-                    start = istart + self._index
-                    stop = istop + self._index
-                    self._npa[
-                        slice(
-                            start %
-                            self.max_size,
-                            stop %
-                            self.max_size,
-                            i.step)] = v
-                    self._npa[
-                        slice(
-                            (start %
-                             self.max_size) + self.max_size, (stop %
-                                                              self.max_size) + self.max_size, i.step)] = v
-        elif isinstance(indexs, numbers.Integral):
-            i = indexs + self._index
-            self._npa[i % self.max_size] = v
-            self._npa[(i % self.max_size) + self.max_size] = v
-        elif isinstance(indexs, slice):
-            istart = indexs.start
-            if istart is None:
-                istart = 0
-            istop = indexs.stop
-            if indexs.stop is None:
-                istop = 0
-            start = istart + self._index
-            stop = istop + self._index
-            self._npa[
-                slice(
-                    start %
-                    self.max_size,
-                    stop %
-                    self.max_size,
-                    indexs.step)] = v
-            self._npa[
-                slice(
-                    (start %
-                     self.max_size) +
-                    self.max_size,
-                    (stop %
-                     self.max_size) +
-                    self.max_size,
-                    indexs.step)] = v
+                if isinstance(i, (numbers.Integral, slice)):
+                    self._npa[self._bufferIndex(i)] = v
+        elif isinstance(indexs, (numbers.Integral, slice)):
+            self._npa[self._bufferIndex(indexs)] = v
         else:
             raise TypeError()
 
@@ -785,14 +1092,31 @@ class NumPyRingBuffer():
             raise TypeError()
 
     def __getattr__(self, a):
-        if self._index < self.max_size:
-            return getattr(self._npa[:self._index], a)
-        return getattr(
-            self._npa[
-                self._index %
-                self.max_size:(
-                    self._index %
-                    self.max_size) + self.max_size], a)
+        if a.startswith('__') or a in NumPyRingBuffer.__slots__:
+            # don't forward special methods (eg. `__deepcopy__`) to the array,
+            # and don't recurse if a slot is not set yet
+            raise AttributeError(a)
+        return getattr(self.getElements(), a)
+
+    def __array__(self, dtype=None, copy=None):
+        # special methods aren't forwarded by __getattr__, so numpy needs this
+        # to convert the buffer without going element by element
+        elements = self.getElements()
+        if copy:
+            return numpy.array(elements, dtype=dtype)
+        return numpy.asarray(elements, dtype=dtype)
+
+    def __copy__(self):
+        rb = NumPyRingBuffer.__new__(NumPyRingBuffer)
+        for name in NumPyRingBuffer.__slots__:
+            setattr(rb, name, getattr(self, name))
+        rb._npa = self._npa.copy()  # copies must not share elements
+        return rb
+
+    def __deepcopy__(self, memo):
+        rb = self.__copy__()
+        memo[id(self)] = rb
+        return rb
 
     def __len__(self):
         if self.isFull():
@@ -812,10 +1136,12 @@ def generatedPointGrid(pixel_width, pixel_height, width_scalar=1.0,
     swidth = pixel_width * width_scalar
     sheight = pixel_height * height_scalar
 
-    # center 0 on screen center
-    x, y = numpy.meshgrid(numpy.linspace(-swidth / 2.0, swidth / 2.0, horiz_points),
-                          numpy.linspace(-sheight / 2.0, sheight / 2.0, vert_points))
-    points = numpy.column_stack((x.flatten(), y.flatten()))
+    # center 0 on screen center; fill the (x, y) columns of the result
+    # directly, row by row, rather than building a meshgrid and stacking it
+    points = numpy.empty((vert_points * horiz_points, 2), dtype=numpy.float64)
+    grid = points.reshape(vert_points, horiz_points, 2)
+    grid[:, :, 0] = numpy.linspace(-swidth / 2.0, swidth / 2.0, horiz_points)
+    grid[:, :, 1] = numpy.linspace(-sheight / 2.0, sheight / 2.0, vert_points)[:, None]
 
     return points
 
@@ -830,12 +1156,80 @@ def generatedPointGrid(pixel_width, pixel_height, width_scalar=1.0,
 # http://gis.stackexchange.com/questions/23587/how-do-i-rotate-the-polygon-about-an-anchor-point-using-python-script
 
 
-def rotate2D(pts, origin, ang=None):
-    '''pts = {} Rotates points(nx2) about center cnt(2) by angle ang(1) in radian'''
+@functools.lru_cache(maxsize=128)
+def _rotationMatrix2D(ang):
+    # read-only since the same array is returned for every call with ang
+    rmat = numpy.array([[numpy.cos(ang), numpy.sin(ang)],
+                        [-numpy.sin(ang), numpy.cos(ang)]], dtype=numpy.float64)
+    rmat.flags.writeable = False
+    return rmat
+
+
+# Numba kernel used by rotate2D. numba is an optional dependency, so the kernel
+# is only used after enableRotate2DKernel() has been called; this is None
+# until then.
+_rotate2DKernel = None
+
+
+def enableRotate2DKernel():
+    """Compile a numba kernel for rotate2D and use it for (n, 2) point arrays.
+
+    Compiling takes a noticeable fraction of a second, so call this before
+    an experiment starts rather than while it is running. The kernel gives the
+    same results as the numpy implementation rotate2D uses otherwise.
+
+    Returns True if the kernel is in use, or False if numba is not installed.
+    """
+    global _rotate2DKernel
+    if _rotate2DKernel is None:
+        try:
+            import numba
+        except ImportError:
+            return False
+
+        @numba.njit(cache=True)
+        def rotate2DKernel(pts, ox, oy, c, s, out):
+            for i in range(pts.shape[0]):
+                dx = pts[i, 0] - ox
+                dy = pts[i, 1] - oy
+                out[i, 0] = c * dx - s * dy + ox
+                out[i, 1] = s * dx + c * dy + oy
+
+        # compile now, rather than on the first call to rotate2D
+        warmUp = numpy.zeros((1, 2), dtype=numpy.float64)
+        rotate2DKernel(warmUp, 0.0, 0.0, 1.0, 0.0, numpy.empty_like(warmUp))
+        _rotate2DKernel = rotate2DKernel
+    return True
+
+
+def rotate2D(pts, origin, ang=None, out=None):
+    '''pts = {} Rotates points(nx2) about center cnt(2) by angle ang(1) in radian.
+
+    The rotation matrix for each angle is cached. An output array with the
+    same shape as pts (float64) can be given with out to avoid allocating a
+    new result array on each call.
+
+    This is compute bound; for the common case of an (n, 2) array of points
+    the rotation can be done by a compiled numba kernel instead, which avoids
+    the numpy call overhead that dominates for small n. See
+    enableRotate2DKernel().'''
     if ang is None:
         ang = numpy.pi / 4
-    return numpy.dot(pts - origin,
-                     numpy.array([[numpy.cos(ang),
-                                   numpy.sin(ang)],
-                                  [-numpy.sin(ang),
-                                   numpy.cos(ang)]])) + origin
+
+    kernel = _rotate2DKernel
+    if kernel is not None:
+        pts = numpy.asarray(pts, dtype=numpy.float64)
+        if pts.ndim == 2 and pts.shape[1] == 2 and numpy.size(origin) == 2:
+            if out is None:
+                out = numpy.empty_like(pts)
+            ox, oy = numpy.ravel(origin)
+            kernel(pts, float(ox), float(oy),
+                   numpy.cos(ang), numpy.sin(ang), out)
+            return out
+
+    rotated = numpy.einsum('...j,ji->...i',
+                           numpy.subtract(pts, origin),
+                           _rotationMatrix2D(float(ang)),
+                           out=out)
+    rotated += origin
+    return rotated
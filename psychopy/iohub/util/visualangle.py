@@ -76,10 +76,12 @@ def generatedPointGrid(pixel_width, pixel_height, width_scalar=1.0,
     """
     swidth = pixel_width * width_scalar
     sheight = pixel_height * height_scalar
-    # center 0 on screen center
-    x, y = np.meshgrid(np.linspace(-swidth / 2.0, swidth / 2.0, horiz_points),
-                       np.linspace(-sheight / 2.0, sheight / 2.0, vert_points))
-    points = np.column_stack((x.flatten(), y.flatten()))
+    # center 0 on screen center; fill the (x, y) columns of the result
+    # directly, row by row, rather than building a meshgrid and stacking it
+    points = np.empty((vert_points * horiz_points, 2), dtype=np.float64)
+    grid = points.reshape(vert_points, horiz_points, 2)
+    grid[:, :, 0] = np.linspace(-swidth / 2.0, swidth / 2.0, horiz_points)
+    grid[:, :, 1] = np.linspace(-sheight / 2.0, sheight / 2.0, vert_points)[:, None]
     return points
 
 # Test it
@@ -404,3 +404,15 @@ def log(msg, level, t=None, obj=None):
     Log the msg, at a  given level on the root logger
     """
     root.log(msg, level=level, t=t, obj=obj)
+
+
+def isEnabledFor(level, logger=root):
+    """Check if messages of a given level would be written to any target
+
+    usage::
+        if logging.isEnabledFor(logging.DEBUG):
+            logging.debug(expensiveMessage())
+
+    Use this to skip building messages which would be discarded anyway.
+    """
+    return level >= logger.lowestTarget
@@ -8,6 +8,7 @@
 
 __all__ = [
     'loadPlugin',
+    'loadAllPlugins',
     'listPlugins',
     'installPlugin',
     'computeChecksum',
@@ -24,37 +25,81 @@ __all__ = [
     'refreshBundlePaths'
 ]
 
+# This module is imported by library users who only need `loadPlugin` and
+# friends, so avoid importing GUI packages (eg. `wx`, `psychopy.app`) or other
+# heavy dependencies at module level. Import them where they are used instead.
 import os
+import re
 import sys
+import stat
+import mmap
 import inspect
-import collections
+import operator
 import hashlib
+import json
 import importlib, importlib.metadata
 import psychopy.tools.pkgtools as pkgtools
-import pkg_resources
-import psychopy.tools.pkgtools as pkgtools
 from psychopy import logging
 from psychopy.preferences import prefs
 
-# add the plugins folder to as a distribution location
-try:
-    pkgtools.addDistribution(prefs.paths['packages'])
-except KeyError:
-    # this error likely wont happen unless the prefs are missing keys
-    logging.error('Cannot add plugin directory as distribution location. '
-                  'Plugins will be unavailable this session.')
-
 # Keep track of plugins that have been loaded. Keys are plugin names and values
 # are their entry point mappings.
-_loaded_plugins_ = collections.OrderedDict()  # use OrderedDict for Py2 compatibility
+_loaded_plugins_ = {}
 
 # Entry points for all plugins installed on the system, this is populated by
 # calling `scanPlugins`. We are caching entry points to avoid having to rescan
 # packages for them.
-_installed_plugins_ = collections.OrderedDict()
+_installed_plugins_ = {}
+
+# Locations and distributions of the plugins in `_installed_plugins_`, keyed by
+# plugin name. Distributions are only found when needed if the plugins were
+# read from the scan cache.
+_installed_plugin_locations_ = {}
+_installed_plugin_dists_ = {}
+
+# File `scanPlugins` caches its results in between sessions, in the user cache
+# directory. Results are reused as long as the search paths haven't changed.
+_pluginScanCacheFile = 'pluginScan.json'
 
 # Keep track of plugins that failed to load here
-_failed_plugins_ = []
+_failed_plugins_ = set()
+
+# Entry points of all installed packages grouped by target group, this is
+# populated on the first call to `getEntryPointGroup` and cleared by
+# `scanPlugins` when packages have changed, since reading the metadata of every
+# installed package is slow.
+_entry_point_groups_ = None
+
+# Entry points assigned by `loadPlugin(..., lazy=True)` which are not imported
+# yet, keyed by the name of the module they were assigned to and then the
+# attribute name. They are loaded by the module's `__getattr__` on first use.
+_lazy_entry_points_ = {}
+
+# Metadata of plugins read by `pluginMetadata`, keyed by plugin name. Cleared
+# by `scanPlugins` when packages have changed.
+_plugin_metadata_ = {}
+
+# Tag of the search paths (see `_pluginScanTag`) from the last `scanPlugins`
+# call, used to tell if packages have changed since.
+_plugin_scan_tag_ = None
+
+# Bundles found by the last `refreshBundlePaths` call, the package index is only
+# refreshed when they change.
+_found_bundles_ = None
+
+# Modules previously found by `resolveObjectFromName`, keyed by their
+# fully-qualified name. The same entry point groups (eg. `psychopy.visual`) are
+# resolved for every plugin loaded. Only modules are kept since they are
+# singletons, other objects may be replaced by plugins.
+_resolved_modules_ = {}
+
+# Pattern of entry point values (`module:attr [extras]`), the same used by
+# `importlib.metadata.EntryPoint`. Parsing values ourselves gives us the module
+# and attribute names on Python 3.8, where entry points don't provide them.
+_entryPointValueRe = re.compile(
+    r'(?P<module>[\w.]+)\s*'
+    r'(:\s*(?P<attr>[\w.]+)\s*)?'
+    r'((?P<extras>\[.*\])\s*)?$')
 
 
 # ------------------------------------------------------------------------------
@@ -83,18 +128,153 @@ def getEntryPointGroup(group, subgroups=False):
 
     if subgroups:
         # if searching subgroups, iterate through entry point groups
-        for thisGroup, eps in importlib.metadata.entry_points().items():
+        for thisGroup, eps in _getEntryPointGroups().items():
             # get entry points within matching group
             if thisGroup.startswith(group):
                 # add to list of all entry points
                 entryPoints += eps
     else:
         # otherwise, just get the requested group
-        entryPoints += importlib.metadata.entry_points().get(group, [])
+        entryPoints += _getEntryPointGroups().get(group, [])
 
     return entryPoints
 
 
+def _getEntryPointGroups():
+    """Get the entry points of all installed packages grouped by the group
+    they target.
+
+    The result is cached after the first call, call `scanPlugins` to refresh
+    it if packages have been installed since. The cache is kept by
+    `scanPlugins` if none of the search paths have changed.
+
+    Returns
+    -------
+    dict
+        Lists of `importlib.metadata.EntryPoint` objects keyed by group name.
+
+    """
+    global _entry_point_groups_
+    if _entry_point_groups_ is not None:
+        return _entry_point_groups_
+
+    groups = {}
+    foundProjects = set()
+    for dist in importlib.metadata.distributions():
+        # only use the first distribution found for a project, like importing
+        projectName = _projectName(dist)
+        if projectName is not None:
+            if projectName in foundProjects:
+                continue
+            foundProjects.add(projectName)
+
+        for ep in dist.entry_points:
+            groups.setdefault(ep.group, []).append(ep)
+
+    _entry_point_groups_ = groups
+
+    return groups
+
+
+def _safeName(name):
+    """Convert a project name to a 'safe name', the same way as
+    `pkg_resources.safe_name` (runs of characters other than letters, digits
+    and '.' are replaced by '-').
+
+    Parameters
+    ----------
+    name : str
+        Project name.
+
+    Returns
+    -------
+    str
+        Safe project name.
+
+    """
+    return re.sub('[^A-Za-z0-9.]+', '-', name)
+
+
+def _projectName(dist):
+    """Get the project name of a distribution, normalized the same way as
+    `pkg_resources` project names.
+
+    Parameters
+    ----------
+    dist : importlib.metadata.Distribution
+        Distribution to get the name of.
+
+    Returns
+    -------
+    str or None
+        Project name, `None` if the distribution has no name in its metadata.
+
+    """
+    name = dist.metadata['Name']
+    if name is None:
+        return None
+
+    return _safeName(name)
+
+
+def _entryPointTarget(ep):
+    """Get the names of the module and attribute an entry point refers to.
+
+    Parameters
+    ----------
+    ep : importlib.metadata.EntryPoint
+        Entry point to get the target of.
+
+    Returns
+    -------
+    tuple
+        Module name and attribute name (`None` if the entry point refers to
+        the module itself).
+
+    """
+    match = _entryPointValueRe.match(ep.value)
+
+    return match.group('module'), match.group('attr')
+
+
+def _isPsychoPyGroup(group):
+    """Check if an entry point group name targets PsychoPy.
+
+    Parameters
+    ----------
+    group : str
+        Entry point group name (eg. 'psychopy.visual').
+
+    Returns
+    -------
+    bool
+        `True` if the group is the `psychopy` namespace or one below it.
+
+    """
+    # most groups are short unrelated names (eg. 'console_scripts'), so an
+    # equality check followed by a dotted prefix rejects them quickly and
+    # doesn't match similarly named packages (eg. 'psychopy_foo')
+    return group == 'psychopy' or group.startswith('psychopy.')
+
+
+def _hasPsychoPyGroups(entryMap):
+    """Check if an entry map has any groups which target PsychoPy.
+
+    Parameters
+    ----------
+    entryMap : dict
+        Entry points of a package keyed by group name.
+
+    Returns
+    -------
+    bool
+        `True` if any group targets the `psychopy` namespace.
+
+    """
+    # stops at the first match and doesn't build an intermediate list
+    return any(_isPsychoPyGroup(group) for group in entryMap)
+
+
 def resolveObjectFromName(name, basename=None, resolve=True, error=True):
     """Get an object within a module's namespace using a fully-qualified or
     relative dotted name.
@@ -182,8 +362,14 @@ def resolveObjectFromName(name, basename=None, resolve=True, error=True):
     if inspect.ismodule(basename):
         basename = basename.__name__
 
-    # get fqn and split
-    fqn = (basename + name if basename is not None else name).split(".")
+    # get fqn, use the module found by a previous call if we have one
+    fqnStr = basename + name if basename is not None else name
+    try:
+        return _resolved_modules_[fqnStr]
+    except KeyError:
+        pass
+
+    fqn = fqnStr.split(".")
 
     # get the object the fqn refers to
     try:
@@ -192,21 +378,39 @@ def resolveObjectFromName(name, basename=None, resolve=True, error=True):
         raise ModuleNotFoundError(
             'Base module cannot be found, has it been imported yet?')
 
-    # walk through the FQN to get the object it refers to
-    path = fqn[0]
-    for attr in fqn[1:]:
-        path += '.' + attr
-        if not hasattr(objref, attr):
-            # try importing the module
+    # fast path, the whole name is usually reachable already (eg. after the
+    # plugin has been loaded) so let `attrgetter` walk it in one go
+    baseObj = objref
+    reachable = True
+    if len(fqn) > 1:
+        try:
+            objref = operator.attrgetter(fqnStr.partition('.')[2])(objref)
+        except AttributeError:
+            reachable = False
+
+    # slow path, walk through the FQN importing modules along the way
+    if not reachable:
+        objref = baseObj
+        for i, attr in enumerate(fqn[1:], start=2):
+            try:
+                objref = getattr(objref, attr)
+                continue
+            except AttributeError:
+                pass
+
+            # try importing the module, only building its name when needed
             if resolve:
-                try:
-                    importlib.import_module(path)
-                except ImportError:
-                    if not error:  # return if suppressing error
-                        return None
-                    raise NameError(
-                        "Specified `name` does not reference a valid object or "
-                        "is unreachable.")
+                path = '.'.join(fqn[:i])
+                # skip the import machinery (and its lock) if imported
+                if path not in sys.modules:
+                    try:
+                        importlib.import_module(path)
+                    except ImportError:
+                        if not error:  # return if suppressing error
+                            return None
+                        raise NameError(
+                            "Specified `name` does not reference a valid "
+                            "object or is unreachable.")
             else:
                 if not error:  # return None if we want to suppress errors
                     return None
@@ -214,11 +418,66 @@ def resolveObjectFromName(name, basename=None, resolve=True, error=True):
                     "Specified `name` does not reference a valid object or is "
                     "unreachable.")
 
-        objref = getattr(objref, attr)
+            objref = getattr(objref, attr)
+
+    if inspect.ismodule(objref):
+        _resolved_modules_[fqnStr] = objref
 
     return objref
 
 
+def _forgetResolvedName(fqn):
+    """Remove a name and any names within it from `_resolved_modules_`.
+
+    Called when an object is assigned to `fqn`, so `resolveObjectFromName`
+    doesn't keep returning the object previously found there.
+
+    Parameters
+    ----------
+    fqn : str
+        Fully-qualified name of the object being replaced.
+
+    """
+    prefix = fqn + '.'
+    for name in [name for name in _resolved_modules_
+                 if name == fqn or name.startswith(prefix)]:
+        del _resolved_modules_[name]
+
+
+# size of the blocks read when hashing a file in `computeChecksum`
+_checksumBufferSize = 1 << 20
+
+
+def _checksumConstructor(name):
+    """Get a constructor for hash `name` which skips OpenSSL's FIPS checks.
+
+    Checksums are only used to check package integrity, so passing
+    `usedforsecurity=False` lets OpenSSL use its CPU accelerated (e.g. SHA-NI)
+    implementations. This argument is only available on Python 3.9+.
+
+    """
+    try:
+        hashlib.new(name, usedforsecurity=False)
+    except TypeError:  # Python 3.8
+        return getattr(hashlib, name)
+
+    return lambda: hashlib.new(name, usedforsecurity=False)
+
+
+# hash constructors available to `computeChecksum`
+_checksumMethods = {
+    'md5': _checksumConstructor('md5'),
+    'sha256': _checksumConstructor('sha256'),
+    'blake2b': hashlib.blake2b}
+
+try:
+    # BLAKE3 uses SIMD and multiple threads, much faster than SHA-256
+    import blake3
+    _checksumMethods['blake3'] = blake3.blake3
+except ImportError:
+    pass
+
+
 def computeChecksum(fpath, method='sha256', writeOut=None):
     """Compute the checksum hash/key for a given package.
 
@@ -229,17 +488,21 @@ def computeChecksum(fpath, method='sha256', writeOut=None):
     ----------
     fpath : str
         Path to the plugin package or file.
-    method : str
-        Hashing method to use, values are 'md5' or 'sha256'. Default is
-        'sha256'.
+    method : str or list of str
+        Hashing method to use, values are 'md5', 'sha256' or 'blake2b', and
+        'blake3' if the `blake3` package is installed. Default is 'sha256'. If
+        a list of methods is given, all checksums are computed while reading
+        the file once.
     writeOut : str
         Path to a text file to write checksum data to. If the file exists, the
-        data will be written as a line at the end of the file.
+        data will be written as a line at the end of the file. Multiple
+        checksums are written as one line each.
 
     Returns
     -------
-    str
-        Checksum hash digested to hexadecimal format.
+    str or dict
+        Checksum hash digested to hexadecimal format. If `method` is a list, a
+        dictionary of checksums keyed by method is returned.
 
     Examples
     --------
@@ -249,24 +512,56 @@ def computeChecksum(fpath, method='sha256', writeOut=None):
             f.write(computeChecksum(
                 '/path/to/plugin/psychopy_plugin-1.0-py3.6.egg'))
 
-    """
-    methodObj = {'md5': hashlib.md5,
-                 'sha256': hashlib.sha256}
+    Compute both the MD5 and SHA-256 checksums of a package::
 
-    hashobj = methodObj[method]()
-    with open(fpath, "rb") as f:
-        chunk = f.read(4096)
-        while chunk != b"":
-            chunk = f.read(4096)
-            hashobj.update(chunk)
+        checksums = computeChecksum(
+            '/path/to/plugin/psychopy_plugin-1.0-py3.6.egg', ['md5', 'sha256'])
+        print(checksums['md5'], checksums['sha256'])
 
-    checksumStr = hashobj.hexdigest()
+    """
+    methods = [method] if isinstance(method, str) else list(method)
+    methodObjs = [_checksumMethods[m] for m in methods]
+
+    with open(fpath, "rb", buffering=0) as f:
+        fileStat = os.fstat(f.fileno())
+        if stat.S_ISREG(fileStat.st_mode) and \
+                0 < fileStat.st_size <= sys.maxsize:
+            # hash regular files straight from the page cache, without copying
+            # them into Python objects first
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(
+                    f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            hashobjs = [methodObj() for methodObj in methodObjs]
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for hashobj in hashobjs:
+                    hashobj.update(mm)
+        elif len(methodObjs) == 1 and hasattr(hashlib, 'file_digest'):
+            # Python 3.11+, hashes in C
+            hashobjs = [hashlib.file_digest(f, methodObjs[0])]
+        else:
+            # feed every block to all hashes so the file is only read once,
+            # reading into the same buffer rather than allocating new blocks
+            hashobjs = [methodObj() for methodObj in methodObjs]
+            buffer = bytearray(_checksumBufferSize)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                block = view[:size]  # no copy
+                for hashobj in hashobjs:
+                    hashobj.update(block)
+
+    checksumStrs = [hashobj.hexdigest() for hashobj in hashobjs]
 
     if writeOut is not None:
         with open(writeOut, 'a') as f:
-            f.write('\n' + checksumStr)
+            f.write(''.join('\n' + checksumStr for checksumStr in checksumStrs))
+
+    if isinstance(method, str):
+        return checksumStrs[0]
 
-    return checksumStr
+    return dict(zip(methods, checksumStrs))
 
 
 def getBundleInstallTarget(projectName):
@@ -288,7 +583,7 @@ def getBundleInstallTarget(projectName):
 
     """
     return os.path.join(
-        prefs.paths['packages'], pkg_resources.safe_name(projectName))
+        prefs.paths['packages'], _safeName(projectName))
 
 
 def refreshBundlePaths():
@@ -313,18 +608,17 @@ def refreshBundlePaths():
         added to `sys.path`.
 
     """
+    global _found_bundles_
     pluginBaseDir = prefs.paths['packages']  # directory packages are in
 
     foundBundles = []
     pluginTopLevelDirs = os.listdir(pluginBaseDir)
     for pluginDir in pluginTopLevelDirs:
         fullPath = os.path.join(pluginBaseDir, pluginDir)
-        allDists = pkg_resources.find_distributions(fullPath, only=False)
-        if not allDists:  # no packages found, move on
-            continue
+        allDists = importlib.metadata.distributions(path=[fullPath])
 
         # does the sud-directory contain an appropriately named distribution?
-        validDist = any([dist.project_name == pluginDir for dist in allDists])
+        validDist = any(_projectName(dist) == pluginDir for dist in allDists)
         if not validDist:
             continue
 
@@ -334,8 +628,10 @@ def refreshBundlePaths():
 
         foundBundles.append(pluginDir)
 
-    # refresh package index since the working set is now stale
-    pkgtools.refreshPackages()
+    # refresh package index if the working set is now stale
+    if set(foundBundles) != _found_bundles_:
+        pkgtools.refreshPackages()
+        _found_bundles_ = set(foundBundles)
 
     return foundBundles
 
@@ -387,34 +683,270 @@ def scanPlugins():
         return the names of the found plugins.
 
     """
-    global _installed_plugins_
-    _installed_plugins_ = {}  # clear installed plugins
+    global _installed_plugins_, _installed_plugin_locations_, \
+        _installed_plugin_dists_, _entry_point_groups_, _plugin_scan_tag_
+
+    # make sure we search the plugin directory too
+    pluginDir = prefs.paths['packages']
+
+    # Nothing has changed since the last scan this session, keep its results as
+    # they are. Checked first since refreshing bundles reloads `pkg_resources`,
+    # installing a new bundle changes the plugin directory and so the tag.
+    if _pluginScanTag(_pluginSearchPaths(pluginDir)) == _plugin_scan_tag_:
+        return len(_installed_plugins_)
 
     refreshBundlePaths()  # refresh plugin bundles directory
 
-    # make sure we have the plugin directory in the working set
-    pluginDir = prefs.paths['packages']
-    if pluginDir not in pkg_resources.working_set.entries:
-        pkg_resources.working_set.add_entry(pluginDir)
+    # add the plugins folder as a distribution location for `pkgtools`, this
+    # is done here rather than on import since it loads `pkg_resources`
+    pkgtools.addDistribution(pluginDir)
+    searchPaths = _pluginSearchPaths(pluginDir)
+
+    # use the results of a previous scan if no search path has changed since,
+    # tagged after adding bundles to `sys.path`
+    scanTag = _pluginScanTag(searchPaths)
+
+    _installed_plugins_ = {}  # clear installed plugins
+    _installed_plugin_locations_ = {}
+    _installed_plugin_dists_ = {}
+    _entry_point_groups_ = None  # packages have changed, rescan them
+    _plugin_metadata_.clear()
+
+    cachedPlugins = _readPluginScanCache(scanTag)
+    if cachedPlugins is not None:
+        for projectName, (location, entryMap) in cachedPlugins.items():
+            _installed_plugins_[projectName] = entryMap
+            _installed_plugin_locations_[projectName] = location
+    else:
+        # find all packages with entry points defined, the first distribution
+        # found for a project shadows the others like it would when importing
+        for dist in importlib.metadata.distributions(path=searchPaths):
+            projectName = _projectName(dist)
+            if projectName is None or projectName in _installed_plugins_:
+                continue
+
+            # group entry points as `{group: {name: entryPoint}}`
+            entryMap = {}
+            for ep in dist.entry_points:
+                entryMap.setdefault(ep.group, {})[ep.name] = ep
+
+            if _hasPsychoPyGroups(entryMap):
+                location = str(dist.locate_file(''))
+                if logging.isEnabledFor(logging.DEBUG):
+                    logging.debug('Found plugin `{}` at location `{}`.'.format(
+                        projectName, location))
+                _installed_plugins_[projectName] = entryMap
+                _installed_plugin_locations_[projectName] = location
+                _installed_plugin_dists_[projectName] = dist
 
-    # find all packages with entry points defined
-    pluginEnv = pkg_resources.Environment()  # supported by the platform
-    dists, _ = pkg_resources.working_set.find_plugins(pluginEnv)
+        _writePluginScanCache(scanTag)
 
-    for dist in dists:
-        entryMap = dist.get_entry_map()
-        if any([i.startswith('psychopy') for i in entryMap.keys()]):
-            logging.debug('Found plugin `{}` at location `{}`.'.format(
-                dist.project_name, dist.location))
-            _installed_plugins_[dist.project_name] = entryMap
+    # make sure the plugins can be imported
+    for location in _installed_plugin_locations_.values():
+        if location not in sys.path:
+            sys.path.append(location)
 
-            # try adding the plugin to the working set
-            if dist.location not in pkg_resources.working_set.entries:
-                pkg_resources.working_set.add(dist)
+    # tag the search paths after adding plugin locations, so calling this again
+    # without any changes finds the same tag
+    _plugin_scan_tag_ = _pluginScanTag(_pluginSearchPaths(pluginDir))
 
     return len(_installed_plugins_)
 
 
+def _pluginSearchPaths(pluginDir):
+    """Get the paths searched for plugins by `scanPlugins`.
+
+    Parameters
+    ----------
+    pluginDir : str
+        User plugin directory, searched after `sys.path`.
+
+    Returns
+    -------
+    list
+        Paths to search for plugins.
+
+    """
+    searchPaths = list(sys.path)
+    if pluginDir not in searchPaths:
+        searchPaths.append(pluginDir)
+
+    return searchPaths
+
+
+def _pluginScanTag(searchPaths):
+    """Get a tag identifying the state of the paths searched for plugins.
+
+    The tag changes if a path is added, removed or reordered, if the
+    modification time of any path changes (eg. a package was installed in it),
+    or if the metadata of a distribution in any path changes (eg. an editable
+    install changed its entry points).
+
+    Parameters
+    ----------
+    searchPaths : list
+        Paths searched for plugins.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the Python version, paths and their modification
+        times.
+
+    """
+    tag = hashlib.sha1(sys.version.encode('utf-8'))
+    for path in searchPaths:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (OSError, ValueError):
+            mtime = None
+        tag.update(repr((path, mtime, _distInfoMTimes(path))).encode('utf-8'))
+
+    return tag.hexdigest()
+
+
+def _distInfoMTimes(path):
+    """Get the modification times of the distribution metadata in a path.
+
+    Parameters
+    ----------
+    path : str
+        Path searched for plugins.
+
+    Returns
+    -------
+    tuple
+        Name and modification times of each `*.dist-info` or `*.egg-info` entry
+        and of the `entry_points.txt` file inside it (`None` if missing).
+
+    """
+    try:
+        with os.scandir(path) as it:
+            names = sorted(entry.name for entry in it if entry.name.endswith(
+                ('.dist-info', '.egg-info')))
+    except (OSError, ValueError):  # not a directory, eg. a zip file
+        return ()
+
+    mtimes = []
+    for name in names:
+        metaPath = os.path.join(path, name)
+        times = []
+        for fpath in (metaPath, os.path.join(metaPath, 'entry_points.txt')):
+            try:
+                times.append(os.stat(fpath).st_mtime_ns)
+            except OSError:
+                times.append(None)
+        mtimes.append((name, tuple(times)))
+
+    return tuple(mtimes)
+
+
+def _readPluginScanCache(scanTag):
+    """Read the plugins found by a previous `scanPlugins` call.
+
+    Parameters
+    ----------
+    scanTag : str
+        Tag for the current search paths from `_pluginScanTag`.
+
+    Returns
+    -------
+    dict or None
+        Location and entry map of each plugin keyed by plugin name. `None` if
+        there is no cache or it was written for different search paths.
+
+    """
+    try:
+        with open(os.path.join(
+                prefs.paths['userCacheDir'], _pluginScanCacheFile), 'r',
+                encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache['tag'] != scanTag:
+            return None
+
+        plugins = {}
+        for projectName, (location, entryMap) in cache['plugins'].items():
+            plugins[projectName] = (location, {
+                group: {
+                    name: importlib.metadata.EntryPoint(name, value, group)
+                    for name, value in eps.items()}
+                for group, eps in entryMap.items()})
+    except Exception:  # missing, unreadable or malformed, so rescan
+        return None
+
+    return plugins
+
+
+def _writePluginScanCache(scanTag):
+    """Save the plugins found by `scanPlugins` so they can be reused by later
+    sessions. Failing to write the cache is not an error.
+
+    Parameters
+    ----------
+    scanTag : str
+        Tag for the current search paths from `_pluginScanTag`.
+
+    """
+    cache = {
+        'tag': scanTag,
+        'plugins': {
+            projectName: (
+                _installed_plugin_locations_[projectName],
+                {group: {name: ep.value for name, ep in eps.items()}
+                 for group, eps in entryMap.items()})
+            for projectName, entryMap in _installed_plugins_.items()}}
+
+    # write to a temporary file first and then replace the cache with it, so
+    # other sessions never read a partly written cache
+    tmpPath = None
+    try:
+        cachePath = os.path.join(
+            prefs.paths['userCacheDir'], _pluginScanCacheFile)
+        tmpPath = '{}.{}.tmp'.format(cachePath, os.getpid())
+        with open(tmpPath, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmpPath, cachePath)
+    except (OSError, KeyError):
+        logging.debug('Failed to write the plugin scan cache.')
+        if tmpPath is not None:
+            try:
+                os.remove(tmpPath)
+            except OSError:
+                pass
+
+
+def _getPluginDist(plugin):
+    """Get the distribution of an installed plugin.
+
+    Parameters
+    ----------
+    plugin : str
+        Name of the plugin package.
+
+    Returns
+    -------
+    importlib.metadata.Distribution or None
+        Distribution of the plugin, `None` if it can't be found.
+
+    """
+    try:
+        return _installed_plugin_dists_[plugin]
+    except KeyError:
+        pass
+
+    # plugins read from the scan cache only know where they are
+    location = _installed_plugin_locations_.get(plugin)
+    if location is None:
+        return None
+
+    for dist in importlib.metadata.distributions(path=[location]):
+        if _projectName(dist) == plugin:
+            _installed_plugin_dists_[plugin] = dist
+            return dist
+
+    return None
+
+
 def listPlugins(which='all'):
     """Get a list of installed or loaded PsychoPy plugins.
 
@@ -480,15 +1012,15 @@ def listPlugins(which='all'):
         raise ValueError("Invalid value specified to argument `which`.")
 
     if which == 'loaded':  # only list plugins we have already loaded
-        return list(_loaded_plugins_.keys())
+        return list(_loaded_plugins_)
     elif which == 'startup':
         return list(prefs.general['startUpPlugins'])  # copy this
     elif which == 'unloaded':
-        return [p for p in listPlugins('all') if p in listPlugins('loaded')]
+        return [p for p in _installed_plugins_ if p not in _loaded_plugins_]
     elif which == 'failed':
-        return list(_failed_plugins_)  # copy
+        return sorted(_failed_plugins_)  # copy, in a stable order
     else:
-        return list(_installed_plugins_.keys())
+        return list(_installed_plugins_)
 
 
 def isPluginLoaded(plugin):
@@ -511,7 +1043,7 @@ def isPluginLoaded(plugin):
     loadPlugin : Load a plugin into the current session.
 
     """
-    return plugin in listPlugins(which='loaded')
+    return plugin in _loaded_plugins_  # dict lookup, don't copy the names
 
 
 def isStartUpPlugin(plugin):
@@ -538,7 +1070,7 @@ def isStartUpPlugin(plugin):
             print('Plugin successfully loaded at startup.')
 
     """
-    return plugin in listPlugins(which='startup')
+    return plugin in prefs.general['startUpPlugins']
 
 
 def loadPluginBuilderElements(plugin):
@@ -574,19 +1106,20 @@ def loadPluginBuilderElements(plugin):
         relevantPoints += list(pts.values())
     # import all relevant classes
     for point in relevantPoints:
+        moduleName, _ = _entryPointTarget(point)
         try:
-            importlib.import_module(point.module_name)
+            importlib.import_module(moduleName)
             return True
         except:
             # if import failed for any reason, log error and mark failure
             logging.error(
-                f"Failed to load {point.module_name}.{point.name} from plugin {plugin}."
+                f"Failed to load {moduleName}.{point.name} from plugin {plugin}."
             )
-            _failed_plugins_.append(plugin)
+            _failed_plugins_.add(plugin)
             return False
 
 
-def loadPlugin(plugin):
+def loadPlugin(plugin, lazy=False):
     """Load a plugin to extend PsychoPy.
 
     Plugins are packages which extend upon PsychoPy's existing functionality by
@@ -624,6 +1157,13 @@ def loadPlugin(plugin):
     plugin : str
         Name of the plugin package to load. This usually refers to the package
         or project name.
+    lazy : bool
+        Defer importing entry points which add new names to a module (eg.
+        `psychopy.visual`) until the name is first accessed. Entry points which
+        replace existing names, target classes, or need registering (eg. window
+        backends and Builder components) are always loaded right away. Since
+        deferred entry points aren't imported here, errors in them are only
+        logged when they are first used.
 
     Returns
     -------
@@ -675,36 +1215,44 @@ def loadPlugin(plugin):
         logging.warning(
             'Package `{}` does not appear to be a valid plugin. '
             'Skipping.'.format(plugin))
-        if plugin not in _failed_plugins_:
-            _failed_plugins_.append(plugin)
+        _failed_plugins_.add(plugin)
 
         return False
 
-    if not any([i.startswith('psychopy') for i in entryMap.keys()]):
+    # only keep groups targeting PsychoPy, sorted so plugins always load their
+    # entry points in the same order
+    psychopyGroups = sorted(
+        (fqn, attrs) for fqn, attrs in entryMap.items()
+        if _isPsychoPyGroup(fqn))
+
+    if not psychopyGroups:
         logging.warning(
             'Specified package `{}` defines no entry points for PsychoPy. '
             'Skipping.'.format(plugin))
 
-        if plugin not in _failed_plugins_:
-            _failed_plugins_.append(plugin)
+        _failed_plugins_.add(plugin)
 
         return False  # can't do anything more here, so return
 
     # go over entry points, looking for objects explicitly for psychopy
-    validEntryPoints = collections.OrderedDict()  # entry points to assign
-    for fqn, attrs in entryMap.items():
-        if not fqn.startswith('psychopy'):
-            continue
+    validEntryPoints = []  # (fqn, targObj, attr, obj) of entry points to assign
+    lazyEntryPoints = []  # entry points to assign without loading them
+    for fqn, attrs in psychopyGroups:
+        # forbid plugins from modifying this module, groups are already known
+        # to target PsychoPy so only the `psychopy` group needs its attributes
+        # checked
+        if fqn == 'psychopy':
+            forbidden = 'plugins' in attrs
+        else:
+            forbidden = fqn == 'psychopy.plugins' or \
+                fqn.startswith('psychopy.plugins.')
 
-        # forbid plugins from modifying this module
-        if fqn.startswith('psychopy.plugins') or \
-                (fqn == 'psychopy' and 'plugins' in attrs):
+        if forbidden:
             logging.error(
                 "Plugin `{}` declares entry points into the `psychopy.plugins` "
                 "module which is forbidden. Skipping.".format(plugin))
 
-            if plugin not in _failed_plugins_:
-                _failed_plugins_.append(plugin)
+            _failed_plugins_.add(plugin)
 
             return False
 
@@ -716,44 +1264,49 @@ def loadPlugin(plugin):
                 "Plugin `{}` specified entry point group `{}` that does not "
                 "exist or is unreachable.".format(plugin, fqn))
 
-            if plugin not in _failed_plugins_:
-                _failed_plugins_.append(plugin)
+            _failed_plugins_.add(plugin)
 
             return False
 
-        validEntryPoints[fqn] = []
+        deferrable = lazy and inspect.ismodule(targObj) and \
+            fqn not in _entryPointRegistrars
 
         # Import modules assigned to entry points and load those entry points.
         # We don't assign anything to PsychoPy's namespace until we are sure
         # that the entry points are valid. This prevents plugins from being
         # partially loaded which can cause all sorts of undefined behaviour.
         for attr, ep in attrs.items():
-            # Load the module the entry point belongs to, this happens
-            # anyways when .load() is called, but we get to access it before
-            # we start binding. If the module has already been loaded, don't
-            # do this again.
-            if ep.module_name not in sys.modules:
+            # new names in a module can be loaded when first accessed instead
+            if deferrable and attr not in vars(targObj):
+                lazyEntryPoints.append((targObj, attr, ep))
+                continue
+
+            # Load the module the entry point belongs to, we get to access it
+            # before we start binding. If the module has already been loaded,
+            # don't do this again.
+            moduleName, attrPath = _entryPointTarget(ep)
+            module = sys.modules.get(moduleName)
+            if module is None:
                 # Do stuff before loading entry points here, any executable code
                 # in the module will run to configure it.
                 try:
-                    imp = importlib.import_module(ep.module_name)
+                    module = importlib.import_module(moduleName)
                 except (ModuleNotFoundError, ImportError):
                     importSuccess = False
                     logging.error(
                         "Plugin `{}` entry point requires module `{}`, but it "
-                        "cannot be imported.".format(plugin, ep.module_name))
+                        "cannot be imported.".format(plugin, moduleName))
                 except:
                     importSuccess = False
                     logging.error(
                         "Plugin `{}` entry point requires module `{}`, but an "
                         "error occurred while loading it.".format(
-                            plugin, ep.module_name))
+                            plugin, moduleName))
                 else:
                     importSuccess = True
 
                 if not importSuccess:  # if we failed to import
-                    if plugin not in _failed_plugins_:
-                        _failed_plugins_.append(plugin)
+                    _failed_plugins_.add(plugin)
 
                     return False
 
@@ -763,37 +1316,29 @@ def loadPlugin(plugin):
             # making changes to existing code where needed. However, plugins
             # are allowed to add new modules to the namespaces of existing
             # ones.
-            if hasattr(targObj, attr):
-                # handle what to do if an attribute exists already here ...
-                if inspect.ismodule(getattr(targObj, attr)):
-                    logging.warning(
-                        "Plugin `{}` attempted to override module `{}`.".format(
-                            plugin, fqn + '.' + attr))
-
-                    # if plugin not in _failed_plugins_:
-                    #     _failed_plugins_.append(plugin)
-                    #
-                    # return False
+            if inspect.ismodule(getattr(targObj, attr, None)):
+                # handle what to do if a module exists already here ...
+                logging.warning(
+                    "Plugin `{}` attempted to override module `{}`.".format(
+                        plugin, fqn + '.' + attr))
+
+                # _failed_plugins_.add(plugin)
+                #
+                # return False
             try:
-                ep = ep.load()  # load the entry point
+                # load the entry point from the module we already have, rather
+                # than `ep.load()` which would parse and import it again
+                obj = module
+                if attrPath is not None:
+                    for name in attrPath.split('.'):
+                        obj = getattr(obj, name)
             except ImportError as e:
                 logging.error(
                     "Failed to load entry point `{}` of plugin `{}`. "
                     "(`{}: {}`) "
                     "Skipping.".format(str(ep), plugin, e.name, e.msg))
 
-                if plugin not in _failed_plugins_:
-                    _failed_plugins_.append(plugin)
-
-                return False
-            except pkg_resources.DistributionNotFound:
-                logging.error(
-                    "Failed to load entry point `{}` of plugin `{}` due to "
-                    "missing distribution required by the application."
-                    "Skipping.".format(str(ep), plugin))
-
-                if plugin not in _failed_plugins_:
-                    _failed_plugins_.append(plugin)
+                _failed_plugins_.add(plugin)
 
                 return False
             except Exception:  # catch everything else
@@ -801,35 +1346,38 @@ def loadPlugin(plugin):
                     "Failed to load entry point `{}` of plugin `{}` for unknown"
                     "reasons. Skipping.".format(str(ep), plugin))
 
-                if plugin not in _failed_plugins_:
-                    _failed_plugins_.append(plugin)
+                _failed_plugins_.add(plugin)
 
                 return False
 
             # If we get here, the entry point is valid and we can safely add it
             # to PsychoPy's namespace.
-            validEntryPoints[fqn].append((targObj, attr, ep))
+            validEntryPoints.append((fqn, targObj, attr, obj))
 
     # Assign entry points that have been successfully loaded. We defer
     # assignment until all entry points are deemed valid to prevent plugins
     # from being partially loaded.
-    for fqn, vals in validEntryPoints.items():
-        for targObj, attr, ep in vals:
-            # add the object to the module or unbound class
-            setattr(targObj, attr, ep)
+    logDebug = logging.isEnabledFor(logging.DEBUG)  # skip unused messages
+    for fqn, targObj, attr, ep in validEntryPoints:
+        # add the object to the module or unbound class
+        setattr(targObj, attr, ep)
+        _forgetResolvedName(fqn + '.' + attr)
+        if logDebug:
             logging.debug(
                 "Assigning to entry point `{}` to `{}`.".format(
-                    ep.__name__, fqn + '.' + attr))
-
-            # --- handle special cases ---
-            if fqn == 'psychopy.visual.backends':  # if window backend
-                _registerWindowBackend(attr, ep)
-            elif fqn == 'psychopy.experiment.components':  # if component
-                _registerBuilderComponent(ep)
-            elif fqn == 'psychopy.experiment.routine':  # if component
-                _registerBuilderStandaloneRoutine(ep)
-            elif fqn == 'psychopy.hardware.photometer':  # photometer
-                _registerPhotometer(ep)
+                    getattr(ep, '__name__', attr), fqn + '.' + attr))
+
+        # handle special cases, eg. registering window backends
+        registerFunc = _entryPointRegistrars.get(fqn)
+        if registerFunc is not None:
+            registerFunc(attr, ep)
+
+    for targObj, attr, ep in lazyEntryPoints:
+        _addLazyEntryPoint(targObj, attr, plugin, ep)
+        if logDebug:
+            logging.debug(
+                "Deferring entry point `{}` assigned to `{}`.".format(
+                    ep.value, targObj.__name__ + '.' + attr))
 
     # Retain information about the plugin's entry points, we will use this for
     # conflict resolution.
@@ -837,15 +1385,147 @@ def loadPlugin(plugin):
 
     # If we made it here on a previously failed plugin, it was likely fixed and
     # can be removed from the list.
-    if plugin not in _failed_plugins_:
-        try:
-            _failed_plugins_.remove(plugin)
-        except ValueError:
-            pass
+    _failed_plugins_.discard(plugin)
 
     return True
 
 
+def _addLazyEntryPoint(module, attr, plugin, ep):
+    """Assign an entry point to a module without loading it.
+
+    The entry point is loaded by the module's `__getattr__` when `attr` is first
+    accessed, and stored in the module's namespace so it is only loaded once.
+    An existing module level `__getattr__` is still used for other names.
+
+    Parameters
+    ----------
+    module : ModuleType
+        Module to assign the entry point to.
+    attr : str
+        Name to assign the entry point to in `module`.
+    plugin : str
+        Name of the plugin which defines the entry point.
+    ep : importlib.metadata.EntryPoint
+        Entry point to load on first access.
+
+    """
+    moduleName = module.__name__
+    _forgetResolvedName(moduleName + '.' + attr)
+    pending = _lazy_entry_points_.get(moduleName)
+    if pending is None:
+        pending = _lazy_entry_points_[moduleName] = {}
+        fallback = vars(module).get('__getattr__')
+
+        def __getattr__(name):
+            try:
+                owner, entryPoint = pending[name]
+            except KeyError:
+                if fallback is not None:
+                    return fallback(name)
+                raise AttributeError(
+                    "module {!r} has no attribute {!r}".format(
+                        moduleName, name)) from None
+
+            try:
+                obj = entryPoint.load()
+            except Exception as e:
+                pending.pop(name, None)
+                logging.error(
+                    "Failed to load entry point `{}` of plugin `{}`.".format(
+                        entryPoint.value, owner))
+                _failed_plugins_.add(owner)
+                raise AttributeError(
+                    "module {!r} has no attribute {!r}".format(
+                        moduleName, name)) from e
+
+            # store the object so this isn't called again for it
+            setattr(module, name, obj)
+            pending.pop(name, None)
+
+            return obj
+
+        module.__getattr__ = __getattr__
+
+    pending[attr] = (plugin, ep)
+
+
+def _importPluginModules(plugin):
+    """Import the modules referred to by the PsychoPy entry points of a plugin.
+
+    Used by :func:`loadAllPlugins` to import plugin modules from worker
+    threads. Errors are ignored here, they are reported when the plugin is
+    loaded by :func:`loadPlugin`.
+
+    Parameters
+    ----------
+    plugin : str
+        Name of the plugin package.
+
+    """
+    entryMap = _installed_plugins_.get(plugin, {})
+    for fqn, attrs in entryMap.items():
+        if not _isPsychoPyGroup(fqn):
+            continue
+
+        for ep in attrs.values():
+            moduleName, _ = _entryPointTarget(ep)
+            if moduleName in sys.modules:
+                continue
+            try:
+                importlib.import_module(moduleName)
+            except Exception:
+                pass
+
+
+def loadAllPlugins(plugins=None, maxWorkers=8):
+    """Load multiple plugins, importing their modules concurrently.
+
+    The modules referred to by the plugins' entry points are imported using a
+    pool of threads first, which hides the latency of reading many files on
+    slow or network drives. Each plugin is then loaded by :func:`loadPlugin`
+    on the calling thread, which is fast since its modules are already
+    imported.
+
+    Parameters
+    ----------
+    plugins : list or None
+        Names of the plugin packages to load. If `None`, all installed plugins
+        returned by :func:`listPlugins` are loaded.
+    maxWorkers : int
+        Maximum number of threads to import modules with.
+
+    Returns
+    -------
+    dict
+        Value returned by :func:`loadPlugin` for each plugin, keyed by plugin
+        name.
+
+    Warnings
+    --------
+    Plugin modules are executed outside of the main thread. Don't use this
+    function for plugins whose modules need to be imported on the main thread
+    (eg. ones that create windows or GUI elements on import), use
+    :func:`loadPlugin` instead.
+
+    Examples
+    --------
+    Load all plugins installed on the system into the current session::
+
+        plugins.loadAllPlugins()
+
+    """
+    plugins = listPlugins() if plugins is None else list(plugins)
+
+    if plugins:
+        import concurrent.futures  # only needed here, keep module import light
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(maxWorkers, len(plugins))) as executor:
+            # bind entry points serially once all modules are imported
+            list(executor.map(_importPluginModules, plugins))
+
+    return {plugin: loadPlugin(plugin) for plugin in plugins}
+
+
 def requirePlugin(plugin):
     """Require a plugin to be already loaded.
 
@@ -871,6 +1551,11 @@ def requirePlugin(plugin):
     RuntimeError
         Plugin has not been previously loaded this session.
 
+    Notes
+    -----
+    Like `assert` statements, this check is skipped if Python is run with
+    optimizations enabled (ie. `python -O`), where this function does nothing.
+
     See Also
     --------
     loadPlugin : Load a plugin into the current session.
@@ -889,7 +1574,10 @@ def requirePlugin(plugin):
             # do something about it ...
 
     """
-    if not isPluginLoaded(plugin):
+    # check loaded plugins directly, this may be called often (eg. when
+    # initializing components) so skip the extra `isPluginLoaded` call, the
+    # whole check is compiled out when running with `-O`
+    if __debug__ and plugin not in _loaded_plugins_:
         raise RuntimeError('Required plugin `{}` has not been loaded.'.format(
             plugin))
 
@@ -975,26 +1663,22 @@ def startUpPlugins(plugins, add=True, verify=True):
 
     # check if the plugins are installed before adding to `startUpPlugins`
     scanPlugins()
-    installedPlugins = listPlugins()
     if verify:
-        notInstalled = [plugin not in installedPlugins for plugin in plugins]
-        if any(notInstalled):
-            missingIdx = [i for i, x in enumerate(notInstalled) if x]
-            errStr = ''  # build up an error string
-            for i, idx in enumerate(missingIdx):
-                if i < len(missingIdx) - 1:
-                    errStr += '`{}`, '.format(plugins[idx])
-                else:
-                    errStr += '`{}`;'.format(plugins[idx])
-
+        missing = [
+            plugin for plugin in plugins if plugin not in _installed_plugins_]
+        if missing:
             raise RuntimeError(
                 "Cannot add startup plugin(s): {} either not installed or has "
-                "no PsychoPy entry points.".format(errStr))
+                "no PsychoPy entry points.".format(
+                    ', '.join('`{}`'.format(plugin) for plugin in missing)))
 
     if add:  # adding plugin names to existing list
+        current = prefs.general['startUpPlugins']
+        present = set(current)
         for plugin in plugins:
-            if plugin not in prefs.general['startUpPlugins']:
-                prefs.general['startUpPlugins'].append(plugin)
+            if plugin not in present:
+                current.append(plugin)
+                present.add(plugin)
     else:
         prefs.general['startUpPlugins'] = plugins  # overwrite
 
@@ -1004,8 +1688,9 @@ def startUpPlugins(plugins, add=True, verify=True):
 def pluginMetadata(plugin):
     """Get metadata from a plugin package.
 
-    Reads the package's PKG_INFO and gets fields as a dictionary. Only packages
-    that have valid entry points to PsychoPy can be queried.
+    Reads the package's metadata (ie. PKG_INFO) and gets fields as a
+    dictionary. Only packages that have valid entry points to PsychoPy can be
+    queried.
 
     Parameters
     ----------
@@ -1015,29 +1700,31 @@ def pluginMetadata(plugin):
     Returns
     -------
     dict
-        Metadata fields.
+        Metadata fields. If a field appears more than once (eg. 'Classifier'),
+        the last value is kept. Metadata is only read once per plugin, until
+        `scanPlugins` finds packages have changed.
 
     """
-    installedPlugins = listPlugins()
-    if plugin not in installedPlugins:
+    if plugin not in _installed_plugins_:
         raise ModuleNotFoundError(
             "Plugin `{}` is not installed or does not have entry points for "
             "PsychoPy.".format(plugin))
 
-    pkg = pkg_resources.get_distribution(plugin)
-    metadata = pkg.get_metadata(pkg.PKG_INFO)
+    try:
+        return dict(_plugin_metadata_[plugin])  # copy, callers may modify it
+    except KeyError:
+        pass
 
-    metadict = {}
-    for line in metadata.split('\n'):
-        if not line:
-            continue
+    pkg = _getPluginDist(plugin)
+    if pkg is None:
+        raise ModuleNotFoundError(
+            "Cannot find the distribution of plugin `{}`.".format(plugin))
 
-        line = line.strip().split(': ')
-        if len(line) == 2:
-            field, value = line
-            metadict[field] = value
+    # already parsed into an `email.message.Message`, which handles folded
+    # fields and ignores the description body
+    metadata = _plugin_metadata_[plugin] = dict(pkg.metadata.items())
 
-    return metadict
+    return dict(metadata)
 
 
 def pluginEntryPoints(plugin, parse=False):
@@ -1064,24 +1751,24 @@ def pluginEntryPoints(plugin, parse=False):
 
     """
     global _installed_plugins_
-    if plugin in _installed_plugins_.keys():
+    if plugin in _installed_plugins_:
         if not parse:
             return _installed_plugins_[plugin]
         else:
             toReturn = {}
             for group, val in _installed_plugins_[plugin].items():
-                if group not in toReturn.keys():
-                    toReturn[group] = {}  # create a new group entry
-
+                groupEntryPoints = toReturn.setdefault(group, {})
                 for attr, ep in val.items():
-                    # parse the entry point specifier
-                    ex = '.'.join(str(ep).split(' = ')[1].split(':'))  # make fqn
-                    toReturn[group].update({attr: ex})
+                    # make the fqn from the parsed module and attribute names,
+                    # `EntryPoint.module` and `.attr` would parse it twice
+                    moduleName, attrPath = _entryPointTarget(ep)
+                    groupEntryPoints[attr] = moduleName + '.' + attrPath \
+                        if attrPath else moduleName
 
             return toReturn
 
     logging.error("Cannot retrieve entry points for plugin `{}`, either not "
-                  " installed or reachable.")
+                  "installed or reachable.".format(plugin))
 
     return None
 
@@ -1143,8 +1830,9 @@ def discoverModuleClasses(nameSpace, classType, includeUnbound=True):
         Which type of classes to get. Any value that `isinstance` or
         `issubclass` expects as its second argument is valid.
     includeUnbound : bool
-        Include unbound classes in the search. If `False` only bound objects are
-        returned. The default is `True`.
+        Include unbound classes in the search. Kept for compatibility, bound and
+        unbound classes are found by the same search so this has no effect on
+        the result.
 
     Returns
     -------
@@ -1197,17 +1885,12 @@ def discoverModuleClasses(nameSpace, classType, includeUnbound=True):
     if module is None:
         raise ImportError("Cannot resolve namespace `{}`".format(nameSpace))
 
+    # `inspect.getmembers` walks the same names as `dir` does, so a single pass
+    # finds both unbound and bound classes
     foundClasses = {}
-
-    if includeUnbound:  # get unbound classes in a module
-        for name, attr in inspect.getmembers(module):
-            if inspect.isclass(attr) and issubclass(attr, classType):
-                foundClasses[name] = attr
-
-    # now get bound objects, overwrites unbound names if they show up
     for name in dir(module):
         attr = getattr(module, name)
-        if inspect.isclass(attr) and issubclass(attr, classType):
+        if isinstance(attr, type) and issubclass(attr, classType):
             foundClasses[name] = attr
 
     return foundClasses
@@ -1252,32 +1935,39 @@ def _registerWindowBackend(attr, ep):
         logging.error("Failed to resolve name `{}`.".format(fqn))
         return   # something weird happened, just exit
 
+    BaseBackend = backend.BaseBackend
+
     # if a module, scan it for valid backends
     foundBackends = {}
+    logDebug = logging.isEnabledFor(logging.DEBUG)  # skip unused messages
     if inspect.ismodule(ep):  # if the backend is a module
-        for attrName in dir(ep):
-            _attr = getattr(ep, attrName)
-            if not inspect.isclass(_attr):  # skip if not class
+        # sorted to register classes in the same order as `dir()` would
+        for attrName, _attr in sorted(vars(ep).items()):
+            if not isinstance(_attr, type):  # skip if not class
                 continue
-            if not issubclass(_attr, backend.BaseBackend):  # not backend
+            if not issubclass(_attr, BaseBackend):  # not backend
                 continue
             # check if the class defines a name for `winType`
-            if not hasattr(_attr, 'winTypeName'):  # has no backend name
+            winTypeName = getattr(_attr, 'winTypeName', None)
+            if winTypeName is None:  # has no backend name
                 continue
             # found something that can be a backend
-            foundBackends[_attr.winTypeName] = '.' + attr + '.' + attrName
-            logging.debug(
-                "Registered window backend class `{}` for `winType={}`.".format(
-                    foundBackends[_attr.winTypeName], _attr.winTypeName))
-    elif inspect.isclass(ep):  # backend passed as a class
-        if not issubclass(ep, backend.BaseBackend):
+            foundBackends[winTypeName] = '.' + attr + '.' + attrName
+            if logDebug:
+                logging.debug(
+                    "Registered window backend class `{}` for `winType={}`."
+                    "".format(foundBackends[winTypeName], winTypeName))
+    elif isinstance(ep, type):  # backend passed as a class
+        if not issubclass(ep, BaseBackend):
             return
-        if not hasattr(ep, 'winTypeName'):
+        winTypeName = getattr(ep, 'winTypeName', None)
+        if winTypeName is None:
             return
-        foundBackends[ep.winTypeName] = '.' + attr
-        logging.debug(
-            "Registered window backend class `{}` for `winType={}`.".format(
-                foundBackends[ep.winTypeName], ep.winTypeName))
+        foundBackends[winTypeName] = '.' + attr
+        if logDebug:
+            logging.debug(
+                "Registered window backend class `{}` for `winType={}`.".format(
+                    foundBackends[winTypeName], winTypeName))
 
     backend.winTypes.update(foundBackends)  # update installed backends
 
@@ -1301,8 +1991,10 @@ def _registerBuilderComponent(ep):
 
     Parameters
     ----------
-    ep : ClassType
-        Class defining the component.
+    ep : ModuleType or ClassType
+        Class defining the component. If a module, the module will be scanned
+        for subclasses of `BaseComponent` defined in it and they will be added
+        as components.
 
     """
     # get reference to the backend class
@@ -1314,13 +2006,29 @@ def _registerBuilderComponent(ep):
         logging.error("Failed to resolve name `{}`.".format(fqn))
         return
 
-    if hasattr(compPkg, 'addComponent'):
-        compPkg.addComponent(ep)
-    else:
+    # look up the function once, rather than `hasattr` then `getattr`
+    addComponent = getattr(compPkg, 'addComponent', None)
+    if addComponent is None:
         raise AttributeError(
             "Cannot find function `addComponent()` in namespace "
             "`{}`".format(fqn))
 
+    if inspect.ismodule(ep):  # if the components are in a module
+        BaseComponent = compPkg.BaseComponent
+        moduleName = ep.__name__
+        # sorted to register classes in the same order as `dir()` would, only
+        # classes defined in the module itself are used, not imported ones
+        for _, _attr in sorted(vars(ep).items()):
+            if not isinstance(_attr, type):  # skip if not class
+                continue
+            if _attr.__module__ != moduleName:
+                continue
+            if not issubclass(_attr, BaseComponent):  # not a component
+                continue
+            addComponent(_attr)
+    else:
+        addComponent(ep)
+
 
 def _registerBuilderStandaloneRoutine(ep):
     """Register a PsychoPy builder standalone routine module.
@@ -1346,8 +2054,9 @@ def _registerBuilderStandaloneRoutine(ep):
         logging.error("Failed to resolve name `{}`.".format(fqn))
         return
 
-    if hasattr(routinePkg, 'addStandaloneRoutine'):
-        routinePkg.addStandaloneRoutine(ep)
+    addStandaloneRoutine = getattr(routinePkg, 'addStandaloneRoutine', None)
+    if addStandaloneRoutine is not None:
+        addStandaloneRoutine(ep)
     else:
         raise AttributeError(
             "Cannot find function `addStandaloneRoutine()` in namespace "
@@ -1376,13 +2085,28 @@ def _registerPhotometer(ep):
         logging.error("Failed to resolve name `{}`.".format(fqn))
         return
 
-    if hasattr(photPkg, 'addPhotometer'):
-        photPkg.addPhotometer(ep)
+    addPhotometer = getattr(photPkg, 'addPhotometer', None)
+    if addPhotometer is not None:
+        addPhotometer(ep)
     else:
         raise AttributeError(
             "Cannot find function `addPhotometer()` in namespace "
             "`{}`".format(fqn))
 
 
+# Functions to call when assigning entry points into these groups, they are
+# called with the attribute name and the loaded entry point.
+_entryPointRegistrars = {
+    'psychopy.visual.backends':  # window backend
+        _registerWindowBackend,
+    'psychopy.experiment.components':  # component
+        lambda attr, ep: _registerBuilderComponent(ep),
+    'psychopy.experiment.routine':  # standalone routine
+        lambda attr, ep: _registerBuilderStandaloneRoutine(ep),
+    'psychopy.hardware.photometer':  # photometer
+        lambda attr, ep: _registerPhotometer(ep),
+}
+
+
 if __name__ == "__main__":
     pass
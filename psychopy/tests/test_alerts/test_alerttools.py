@@ -1,4 +1,5 @@
 import sys
+import pytest
 from psychopy.alerts import alerttools
 from psychopy.alerts._errorHandler import _BaseErrorHandler
 from psychopy.experiment import getAllComponents, Experiment
@@ -7,6 +8,12 @@ from psychopy.experiment import getAllComponents, Experiment
 class TestAlertTools():
     """A class for testing the alerttools module"""
 
+    @classmethod
+    def setup_class(cls):
+        # finding components imports and inspects all of them, so only do it
+        # once, each test still makes fresh components from these classes
+        cls.allComp = getAllComponents(fetchIcons=False)
+
     def setup_method(self):
         # Set ErrorHandler
         self.error = _BaseErrorHandler()
@@ -16,52 +23,88 @@ class TestAlertTools():
         trial = self.exp.addRoutine('trial')
         self.exp.flow.addRoutine(trial, 0)
 
-        allComp = getAllComponents(fetchIcons=False)
-
         # Polygon
-        self.polygonComp = allComp["PolygonComponent"](parentName='trial',
-                                                       exp=self.exp)
+        self.polygonComp = self.allComp["PolygonComponent"](
+            parentName='trial', exp=self.exp)
         trial.addComponent(self.polygonComp)
         self.polygonComp.params['units'].val = 'height'
         self.polygonComp.params['startType'].val = "time (s)"
         self.polygonComp.params['stopType'].val = "time (s)"
 
         # Code component
-        self.codeComp = allComp["CodeComponent"](parentName='trial',
-                                                 exp=self.exp)
+        self.codeComp = self.allComp["CodeComponent"](
+            parentName='trial', exp=self.exp)
         self.codeComp.params['Begin Experiment'].val = "(\n"
         self.codeComp.params['Begin JS Experiment'].val = "{\n"
 
 
-    def test_2115_X_too_large(self):
-        self.polygonComp.params['size'].val = [4, .5]
-        self.exp.integrityCheck()
-        assert ('Your stimulus size exceeds the X dimension of your window.' in self.error.alerts[0].msg)
-
-    def test_2115_Y_too_large(self):
-        self.polygonComp.params['size'].val = [.5, 4]
-        self.exp.integrityCheck()
-        assert ('Your stimulus size exceeds the Y dimension of your window.' in self.error.alerts[0].msg)
-
-    def test_size_too_small_x(self):
-        self.polygonComp.params['size'].val = [.0000001, .05]
-        self.exp.integrityCheck()
-        assert ('Your stimulus size is smaller than 1 pixel (X dimension)' in self.error.alerts[0].msg)
-
-    def test_size_too_small_y(self):
-        self.polygonComp.params['size'].val = [.05, .0000001]
-        self.exp.integrityCheck()
-        assert ('Your stimulus size is smaller than 1 pixel (Y dimension)' in self.error.alerts[0].msg)
-
-    def test_position_x_dimension(self):
-        self.polygonComp.params['pos'].val = [4, .5]
-        self.exp.integrityCheck()
-        assert ('Your stimulus position exceeds the X dimension' in self.error.alerts[0].msg)
-
-    def test_position_y_dimension(self):
-        self.polygonComp.params['pos'].val = [.5, 4]
+    @pytest.mark.parametrize('params, code, msg', [
+        pytest.param(
+            {'size': [4, .5]},
+            2115,
+            'Your stimulus size exceeds the X dimension of your window.',
+            id='2115_X_too_large'),
+        pytest.param(
+            {'size': [.5, 4]},
+            2115,
+            'Your stimulus size exceeds the Y dimension of your window.',
+            id='2115_Y_too_large'),
+        pytest.param(
+            {'size': [.0000001, .05]},
+            2120,
+            'Your stimulus size is smaller than 1 pixel (X dimension)',
+            id='size_too_small_x'),
+        pytest.param(
+            {'size': [.05, .0000001]},
+            2120,
+            'Your stimulus size is smaller than 1 pixel (Y dimension)',
+            id='size_too_small_y'),
+        pytest.param(
+            {'pos': [4, .5]},
+            2155,
+            'Your stimulus position exceeds the X dimension',
+            id='position_x_dimension'),
+        pytest.param(
+            {'pos': [.5, 4]},
+            2155,
+            'Your stimulus position exceeds the Y dimension',
+            id='position_y_dimension'),
+        pytest.param(
+            {'startVal': 12, 'stopVal': 10},
+            4105,
+            'Your stimulus start time exceeds the stop time',
+            id='timing'),
+        pytest.param(
+            {'startVal': .001},
+            3110,
+            'Your stimulus start time of 0.001 is less than a screen refresh '
+            'for a 60Hz monitor',
+            id='achievable_visual_stim_onset'),
+        pytest.param(
+            {'stopVal': .001, 'stopType': "duration (s)"},
+            3110,
+            'Your stimulus stop time of 0.001 is less than a screen refresh '
+            'for a 60Hz monitor',
+            id='achievable_visual_stim_offset'),
+        pytest.param(
+            {'startVal': 1.01, 'stopVal': 2.01},
+            3115,
+            'start time of 1.01 seconds cannot be accurately presented',
+            id='valid_visual_timing'),
+        pytest.param(
+            {'startVal': .5, 'startType': "duration (frames)"},
+            4115,
+            "Your stimulus start type 'duration (frames)' must be expressed as "
+            "a whole number",
+            id='4115_frames_as_int'),
+    ])
+    def test_integrityCheck(self, params, code, msg):
+        for name, val in params.items():
+            self.polygonComp.params[name].val = val
         self.exp.integrityCheck()
-        assert ('Your stimulus position exceeds the Y dimension' in self.error.alerts[0].msg)
+        # the code identifies the alert, the message tells its variants apart
+        assert self.error.alerts[0].code == code
+        assert (msg in self.error.alerts[0].msg)
 
     def test_variable_fail(self):
         self.polygonComp.params['pos'].val = '$pos'
@@ -69,46 +112,20 @@ class TestAlertTools():
         self.exp.integrityCheck()
         assert (len(self.error.alerts) == 0)
 
-    def test_timing(self):
-        self.polygonComp.params['startVal'].val = 12
-        self.polygonComp.params['stopVal'].val = 10
-        self.exp.integrityCheck()
-        assert ('Your stimulus start time exceeds the stop time' in self.error.alerts[0].msg)
-
     def test_disabled(self):
         self.polygonComp.params['disabled'].val = True
         alerttools.testDisabled(self.polygonComp)
+        assert self.error.alerts[0].code == 4305
         assert (f"The component {self.polygonComp.params['name']} is currently disabled" in self.error.alerts[0].msg)
 
-    def test_achievable_visual_stim_onset(self):
-        self.polygonComp.params['startVal'].val = .001
-        self.exp.integrityCheck()
-        assert ('Your stimulus start time of 0.001 is less than a screen refresh for a 60Hz monitor' in self.error.alerts[0].msg)
-
-    def test_achievable_visual_stim_offset(self):
-        self.polygonComp.params['stopVal'].val = .001
-        self.polygonComp.params['stopType'].val = "duration (s)"
-        self.exp.integrityCheck()
-        assert ('Your stimulus stop time of 0.001 is less than a screen refresh for a 60Hz monitor' in self.error.alerts[0].msg)
-
-    def test_valid_visual_timing(self):
-        self.polygonComp.params['startVal'].val = 1.01
-        self.polygonComp.params['stopVal'].val = 2.01
-        self.exp.integrityCheck()
-        assert ('start time of 1.01 seconds cannot be accurately presented' in self.error.alerts[0].msg)
-
-    def test_4115_frames_as_int(self):
-        self.polygonComp.params['startVal'].val = .5
-        self.polygonComp.params['startType'].val = "duration (frames)"
-        self.exp.integrityCheck()
-        assert ("Your stimulus start type \'duration (frames)\' must be expressed as a whole number" in self.error.alerts[0].msg)
-
     def test_python_syntax(self):
         alerttools.checkPythonSyntax(self.codeComp, 'Begin Experiment')
+        assert self.error.alerts[0].code == 4205
         assert ("Python Syntax Error in 'Begin Experiment'" in self.error.alerts[0].msg)
 
     def test_javascript_syntax(self):
         alerttools.checkJavaScriptSyntax(self.codeComp, 'Begin JS Experiment')
+        assert self.error.alerts[0].code == 4210
         assert ("JavaScript Syntax Error in 'Begin JS Experiment'" in self.error.alerts[0].msg)
 
 def test_validDuration():
@@ -125,7 +142,14 @@ def test_validDuration():
     for this in testVals:
         assert alerttools.validDuration(this['t'], this['hz']) == this['ans']
 
+    # all at once
+    valid = alerttools.validDuration(
+        [this['t'] for this in testVals], [this['hz'] for this in testVals])
+    assert valid.tolist() == [this['ans'] for this in testVals]
+    assert alerttools.validDuration("0.5", 60) is True
+
 if __name__ == "__main__":
     tester = TestAlertTools()
+    tester.setup_class()
     tester.setup_method()
     tester.test_sizing_x_dimension()
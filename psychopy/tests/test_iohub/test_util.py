@@ -0,0 +1,233 @@
+""" Test psychopy.iohub.util helpers which don't need an ioHub server
+"""
+import os
+import copy
+import numpy
+import pytest
+
+from psychopy.iohub import util
+
+
+def test_readConfigCache(tmp_path):
+    cfgPath = str(tmp_path / 'config.yaml')
+    with open(cfgPath, 'w') as f:
+        f.write('device:\n  name: a\n')
+
+    config = util.readConfig(cfgPath)
+    assert config == {'device': {'name': 'a'}}
+    # callers get copies, so changing them doesn't change the cache
+    config['device']['name'] = 'changed'
+    assert util.readConfig(cfgPath) == {'device': {'name': 'a'}}
+    # parsed configs are only kept in memory
+    assert os.listdir(str(tmp_path)) == ['config.yaml']
+
+    # a changed file is parsed again, even if its mtime goes backwards
+    stat = os.stat(cfgPath)
+    with open(cfgPath, 'w') as f:
+        f.write('device:\n  name: bb\n')
+    os.utime(cfgPath, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 9))
+    assert util.readConfig(cfgPath) == {'device': {'name': 'bb'}}
+
+
+def test_memoizeDeviceQuery(monkeypatch, tmp_path):
+    calls = []
+
+    @util._memoizeDeviceQuery
+    def query(name):
+        calls.append(name)
+        return [('path', name)]
+
+    refreshes = []
+    monkeypatch.setattr(
+        util.plugins, 'refreshBundlePaths', lambda: refreshes.append(1))
+    packagesDir = tmp_path / 'packages'
+    packagesDir.mkdir()
+    monkeypatch.setitem(util.prefs.paths, 'packages', str(packagesDir))
+    monkeypatch.setattr(util, '_bundlesMTime', None)
+    result = query('a')
+    assert result == [('path', 'a')]
+    result.append('changed')  # callers get copies
+    assert query('a') == [('path', 'a')]
+    assert calls == ['a']
+    # bundles are only looked for again if the packages directory changed
+    assert len(refreshes) == 1
+    stat = os.stat(str(packagesDir))
+    os.utime(str(packagesDir), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert query('a') == [('path', 'a')]
+    assert len(refreshes) == 2
+    assert calls == ['a', 'a']  # maybe new devices, so queried again
+
+    # new search paths, eg. from a newly installed plugin bundle, are searched
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert query('a') == [('path', 'a')]
+    assert calls == ['a', 'a', 'a']
+
+
+def test_deviceFiles(monkeypatch, tmp_path):
+    deviceDir = tmp_path / 'mydevice'
+    deviceDir.mkdir()
+    (deviceDir / 'default_mydevice.yaml').write_text(
+        'mydevice.Device:\n  name: mine\n  builder_hides: [secret]\n'
+        '  secret: 1\n')
+    (deviceDir / 'supported_config_settings.yaml').write_text(
+        'mydevice.Device:\n  name: IOHUB_STRING\n')
+    monkeypatch.setattr(
+        util, 'getDevicePaths',
+        lambda device_name="": [(str(deviceDir), 'default_mydevice.yaml')])
+
+    # only the files asked for are read
+    readPaths = []
+    readConfig = util.readConfig
+
+    def spyReadConfig(path):
+        readPaths.append(os.path.basename(path))
+        return readConfig(path)
+
+    monkeypatch.setattr(util, 'readConfig', spyReadConfig)
+    util.getDeviceDefaultConfig.cache_clear()
+    assert util.getDeviceDefaultConfig('mydevice') == [
+        {'mydevice.Device': {'name': 'mine', 'builder_hides': ['secret']}}]
+    assert readPaths == ['default_mydevice.yaml']
+
+    readPaths.clear()
+    assert util.getDeviceFile('mydevice', 'supported_config_settings.yaml') == \
+        {'name': 'IOHUB_STRING'}
+    assert readPaths == ['supported_config_settings.yaml']
+
+    # missing files are an error, rather than silently returning None
+    with pytest.raises(FileNotFoundError):
+        util.getDeviceFile('mydevice', 'builder_hints.yaml')
+
+
+def _ringBufferContents(values, maxSize):
+    # what a NumPyRingBuffer should hold after values were added to it
+    return numpy.asarray(values[-maxSize:], dtype=numpy.float32)
+
+
+@pytest.mark.parametrize('nValues', [0, 3, 10, 13, 25])
+def test_ringBufferAppend(nValues):
+    rb = util.NumPyRingBuffer(10)
+    values = list(range(nValues))
+    for v in values:
+        rb.append(v)
+
+    expected = _ringBufferContents(values, 10)
+    assert len(rb) == len(expected)
+    assert rb.isFull() == (nValues >= 10)
+    numpy.testing.assert_array_equal(rb.getElements(), expected)
+    numpy.testing.assert_array_equal(rb[-3:], expected[-3:])
+    if nValues:
+        numpy.testing.assert_array_equal(
+            rb[[0, slice(-2, None)]], expected[[0, -2, -1]])
+
+
+@pytest.mark.parametrize('chunks', [
+    [3, 4], [7, 7], [25], [4, 12], [9, 1, 9, 1]])
+def test_ringBufferExtend(chunks):
+    rb = util.NumPyRingBuffer(10)
+    values = []
+    for n in chunks:
+        chunk = list(range(len(values), len(values) + n))
+        rb.extend(chunk)
+        values.extend(chunk)
+        numpy.testing.assert_array_equal(
+            rb.getElements(), _ringBufferContents(values, 10))
+
+    # the same as appending one at a time
+    rbAppend = util.NumPyRingBuffer(10)
+    for v in values:
+        rbAppend.append(v)
+    numpy.testing.assert_array_equal(rb.getElements(), rbAppend.getElements())
+
+
+def test_ringBufferSetItem():
+    rb = util.NumPyRingBuffer(5)
+    rb.extend(range(8))  # wrapped, holds 3..7
+    rb[0] = 30
+    rb[-1] = 70
+    rb[1:3] = -1
+    numpy.testing.assert_array_equal(rb.getElements(), [30, -1, -1, 6, 70])
+    rb.append(8)  # the oldest element is the one dropped
+    numpy.testing.assert_array_equal(rb.getElements(), [-1, -1, 6, 70, 8])
+
+    rb.clear()
+    assert len(rb) == 0
+    rb.extend([1, 2])
+    numpy.testing.assert_array_equal(rb.getElements(), [1, 2])
+
+
+@pytest.mark.parametrize('nValues', [1, 7, 10, 17])
+@pytest.mark.parametrize('method', ['min', 'max', 'sum', 'mean', 'std', 'var'])
+def test_ringBufferReductions(monkeypatch, nValues, method):
+    rb = util.NumPyRingBuffer(10)
+    rb.extend(numpy.random.default_rng(nValues).normal(size=nValues))
+    elements = numpy.asarray(rb.getElements())
+
+    # reduced over the backing array without copying the elements out of it
+    with monkeypatch.context() as m:
+        m.setattr(util.NumPyRingBuffer, 'getElements', None)
+        assert getattr(rb, method)() == pytest.approx(
+            getattr(elements, method)())
+    # arguments are passed on to numpy
+    assert getattr(rb, method)(axis=0) == pytest.approx(
+        getattr(elements, method)(axis=0))
+
+
+def test_ringBufferGetElements():
+    rb = util.NumPyRingBuffer(4)
+    rb.extend(range(6))  # wrapped
+    elements = rb.getElements()
+    # once wrapped, each call returns a new array rather than reusing one
+    rb.extend([10, 11])
+    numpy.testing.assert_array_equal(elements, [2, 3, 4, 5])
+    numpy.testing.assert_array_equal(rb.getElements(), [4, 5, 10, 11])
+
+
+@pytest.mark.parametrize('copyFunc', [copy.copy, copy.deepcopy])
+def test_ringBufferCopy(copyFunc):
+    rb = util.NumPyRingBuffer(4)
+    rb.extend(range(6))
+    rbCopy = copyFunc(rb)
+    assert isinstance(rbCopy, util.NumPyRingBuffer)
+    numpy.testing.assert_array_equal(rbCopy.getElements(), [2, 3, 4, 5])
+
+    # copies are independent
+    rb.append(6)
+    rbCopy.append(60)
+    numpy.testing.assert_array_equal(rb.getElements(), [3, 4, 5, 6])
+    numpy.testing.assert_array_equal(rbCopy.getElements(), [3, 4, 5, 60])
+
+    # special methods aren't looked up on the element array, but numpy can
+    # still convert the buffer
+    assert not hasattr(rb, '__array_interface__')
+    numpy.testing.assert_array_equal(numpy.asarray(rb), [3, 4, 5, 6])
+
+
+def test_rotate2DKernel(monkeypatch):
+    pytest.importorskip('numba')
+    rng = numpy.random.default_rng(0)
+    pts = rng.normal(size=(50, 2)) * 100
+    cases = [((0, 0), None), ((10.5, -3), 0.3), (numpy.array([-5., 7.]), -2.)]
+
+    monkeypatch.setattr(util, '_rotate2DKernel', None)
+    expected = [util.rotate2D(pts, origin, ang) for origin, ang in cases]
+
+    assert util.enableRotate2DKernel()
+    assert util._rotate2DKernel is not None
+    for (origin, ang), exp in zip(cases, expected):
+        numpy.testing.assert_allclose(
+            util.rotate2D(pts, origin, ang), exp, rtol=1e-12, atol=1e-12)
+        out = numpy.empty_like(pts)
+        assert util.rotate2D(pts, origin, ang, out=out) is out
+        numpy.testing.assert_allclose(out, exp, rtol=1e-12, atol=1e-12)
+
+
+def test_readBytesShortReads(monkeypatch, tmp_path):
+    path = tmp_path / 'config.yaml'
+    data = b'device:\n  name: ' + b'x' * 5000 + b'\n'
+    path.write_bytes(data)
+
+    # reads may return fewer bytes than asked for, eg. on network drives
+    osRead = os.read
+    monkeypatch.setattr(util.os, 'read', lambda fd, n: osRead(fd, min(n, 100)))
+    assert util._readBytes(str(path)) == data
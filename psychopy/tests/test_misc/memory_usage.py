@@ -3,7 +3,7 @@ import pytest
 import numpy as np
 import shutil, os
 from tempfile import mkdtemp
-from psychopy.tests import utils
+from psychopy.tests import utils, requires_plugin
 
 
 # Testing for memory leaks in PsychoPy classes (experiment run-time, not Builder, Coder, etc)
@@ -129,6 +129,7 @@ class TestMemory():
         for txt in ['a', 'a'*1000]:
             assert leakage(visual.TextStim, win, txt) < THRESHOLD, msg
 
+    @requires_plugin("psychopy-legacy")
     def test_RatingScale(self):
         msg = "RatingScale will probably leak if TextStim does"
         # 'hover' has few visual items (no text, line, marker, accept box)
@@ -1,10 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import numpy as np
+import math
+import pytest
+from unittest.mock import MagicMock
 
 from psychopy.clock import wait, StaticPeriod, CountdownTimer
-from psychopy.visual import Window
 from psychopy.tools import systemtools
 
 
@@ -27,13 +28,34 @@ def test_StaticPeriod_overrun():
 
 
 def test_StaticPeriod_recordFrameIntervals():
+    # StaticPeriod only toggles `recordFrameIntervals`, no need for a real
+    # window here
+    win = MagicMock(recordFrameIntervals=True)
+    static = StaticPeriod(screenHz=60, win=win)
+    static.start(.002)
+    assert win.recordFrameIntervals is False
+    static.complete()
+    assert static._winWasRecordingIntervals is True
+    assert win.recordFrameIntervals is True
+
+
+@pytest.fixture(scope="module")
+def win():
+    # shared by tests needing a real window, creating one is slow
+    from psychopy.visual import Window
+
     win = Window(autoLog=False)
+    yield win
+    win.close()
+
+
+@pytest.mark.slow
+def test_StaticPeriod_recordFrameIntervals_window(win):
     static = StaticPeriod(screenHz=60, win=win)
     static.start(.002)
     assert win.recordFrameIntervals is False
     static.complete()
     assert static._winWasRecordingIntervals == win.recordFrameIntervals
-    win.close()
 
 
 def test_StaticPeriod_screenHz():
@@ -44,7 +66,7 @@ def test_StaticPeriod_screenHz():
     refresh_rate = 100.0
     period_duration = 0.1
     timer = CountdownTimer()
-    win = Window(autoLog=False)
+    win = MagicMock(recordFrameIntervals=False)
 
     static = StaticPeriod(screenHz=refresh_rate, win=win)
     static.start(period_duration)
@@ -55,7 +77,6 @@ def test_StaticPeriod_screenHz():
         tolerance = 0.01  # without a proper screen timing might not be sub-ms
     else:
         tolerance = 0.001
-    assert np.allclose(timer.getTime(),
-                       1.0/refresh_rate,
-                       atol=tolerance)
-    win.close()
+    assert math.isclose(timer.getTime(),
+                        1.0/refresh_rate,
+                        abs_tol=tolerance)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for psychopy.plugins.computeChecksum
+
+"""
+import os
+import hashlib
+import threading
+import pytest
+
+from tempfile import mkdtemp
+from psychopy.plugins import computeChecksum
+
+
+# sizes around the block sizes used for reading files
+fileSizes = [0, 1, 4095, 4096, 4097, 10000, (1 << 20) + 123]
+
+
+@pytest.fixture(scope='module')
+def testFiles():
+    tmpDir = mkdtemp(prefix='psychopy-tests-checksum')
+    files = []
+    for size in fileSizes:
+        fpath = os.path.join(tmpDir, 'data{}.bin'.format(size))
+        with open(fpath, 'wb') as f:
+            f.write(os.urandom(size))
+        files.append(fpath)
+
+    return files
+
+
+@pytest.mark.parametrize('method', ['md5', 'sha256', 'blake2b'])
+def test_computeChecksum(testFiles, method):
+    for fpath in testFiles:
+        with open(fpath, 'rb') as f:
+            expected = hashlib.new(method, f.read()).hexdigest()
+
+        assert computeChecksum(fpath, method) == expected
+
+
+def test_computeChecksumWriteOut(testFiles):
+    outFile = os.path.join(os.path.dirname(testFiles[0]), 'checksums.txt')
+    checksums = [computeChecksum(fpath, writeOut=outFile)
+                 for fpath in testFiles]
+
+    with open(outFile, 'r') as f:
+        assert f.read() == ''.join('\n' + c for c in checksums)
+
+
+def test_computeChecksumMultiple(testFiles):
+    methods = ['md5', 'sha256', 'blake2b']
+    for fpath in testFiles:
+        checksums = computeChecksum(fpath, methods)
+        assert list(checksums) == methods
+        for method in methods:
+            assert checksums[method] == computeChecksum(fpath, method)
+
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="requires named pipes")
+def test_computeChecksumStream(testFiles):
+    # pipes can't be memory mapped, so these are read block by block
+    fifoPath = os.path.join(os.path.dirname(testFiles[0]), 'checksum.fifo')
+    os.mkfifo(fifoPath)
+    try:
+        for fpath in testFiles:
+            with open(fpath, 'rb') as f:
+                data = f.read()
+
+            def writeData():
+                with open(fifoPath, 'wb') as fifo:
+                    fifo.write(data)
+
+            writer = threading.Thread(target=writeData)
+            writer.start()
+            checksums = computeChecksum(fifoPath, ['md5', 'sha256'])
+            writer.join()
+
+            assert checksums['md5'] == hashlib.md5(data).hexdigest()
+            assert checksums['sha256'] == hashlib.sha256(data).hexdigest()
+    finally:
+        os.remove(fifoPath)
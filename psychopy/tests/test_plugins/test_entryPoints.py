@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the entry point cache in psychopy.plugins
+
+"""
+import os
+import sys
+import psychopy.plugins as plugins
+
+
+def _fakeDistributions(tmp_path):
+    """Make a package with entry points in `tmp_path`, and get a replacement
+    for `importlib.metadata.distributions` which only finds it.
+    """
+    from importlib.metadata import PathDistribution
+
+    distInfo = tmp_path / 'psychopy_x-1.0.dist-info'
+    distInfo.mkdir()
+    (distInfo / 'METADATA').write_text(
+        'Metadata-Version: 2.1\nName: psychopy-x\nVersion: 1.0\n')
+    (distInfo / 'entry_points.txt').write_text(
+        '[console_scripts]\nx = plugmod:main\n\n'
+        '[psychopy.visual]\nStim = plugmod:Stim\n')
+    dists = [PathDistribution(distInfo)]
+
+    return lambda **kwargs: iter(dists)
+
+
+def test_entryPointGroupCache(monkeypatch, tmp_path):
+    # scan a known set of packages, and keep the scan cache out of the user's
+    # cache directory
+    cacheDir = tmp_path / 'cache'
+    cacheDir.mkdir()
+    monkeypatch.setitem(plugins.prefs.paths, 'userCacheDir', str(cacheDir))
+    monkeypatch.setattr(
+        plugins.importlib.metadata, 'distributions',
+        _fakeDistributions(tmp_path))
+    monkeypatch.setattr(sys, 'path', list(sys.path))  # plugins get added
+    for name in ('_installed_plugins_', '_installed_plugin_locations_',
+                 '_installed_plugin_dists_', '_entry_point_groups_',
+                 '_plugin_scan_tag_', '_found_bundles_'):
+        monkeypatch.setattr(plugins, name, getattr(plugins, name))
+
+    plugins.scanPlugins()
+    assert plugins.listPlugins() == ['psychopy-x']
+    groups = plugins._getEntryPointGroups()
+    assert plugins._getEntryPointGroups() is groups
+
+    # nothing installed since, so the entry points and plugins are kept
+    # without looking for new bundles (which reloads `pkg_resources`)
+    installed = plugins._installed_plugins_
+    refreshBundlePaths = plugins.refreshBundlePaths
+    monkeypatch.setattr(plugins, 'refreshBundlePaths', None)
+    plugins.scanPlugins()
+    monkeypatch.setattr(plugins, 'refreshBundlePaths', refreshBundlePaths)
+    assert plugins._getEntryPointGroups() is groups
+    assert plugins._installed_plugins_ is installed
+
+    # search paths changed, so the entry points are read again
+    monkeypatch.setattr(plugins, '_plugin_scan_tag_', None)
+    plugins.scanPlugins()
+    assert plugins._getEntryPointGroups() is not groups
+
+    # groups are copied out of the cache
+    entryPoints = plugins.getEntryPointGroup('console_scripts')
+    assert [ep.value for ep in entryPoints] == ['plugmod:main']
+    nEntryPoints = len(entryPoints)
+    entryPoints.append(None)
+    assert len(plugins.getEntryPointGroup('console_scripts')) == nEntryPoints
+
+
+def test_pluginScanTag(tmp_path):
+    distInfo = tmp_path / 'psychopy_x-1.0.dist-info'
+    distInfo.mkdir()
+    entryPoints = distInfo / 'entry_points.txt'
+    entryPoints.write_text('[psychopy.visual]\nStim = plugmod:Stim\n')
+    searchPaths = [str(tmp_path)]
+    tag = plugins._pluginScanTag(searchPaths)
+    assert plugins._pluginScanTag(searchPaths) == tag
+
+    # entry points changed in place, eg. by an editable install, while the
+    # search path itself is unchanged
+    stat = os.stat(str(tmp_path))
+    entryPoints.write_text('[psychopy.visual]\nOther = plugmod:Other\n')
+    os.utime(str(entryPoints), ns=(
+        entryPoints.stat().st_atime_ns, entryPoints.stat().st_mtime_ns + 10 ** 9))
+    os.utime(str(tmp_path), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert plugins._pluginScanTag(searchPaths) != tag
+
+
+def test_writePluginScanCache(monkeypatch, tmp_path):
+    monkeypatch.setitem(plugins.prefs.paths, 'userCacheDir', str(tmp_path))
+    monkeypatch.setattr(plugins, '_installed_plugins_', {})
+    monkeypatch.setattr(plugins, '_installed_plugin_dists_', {})
+    plugins._writePluginScanCache('tag')
+    # the cache is replaced in one step, leaving no temporary files behind
+    assert os.listdir(str(tmp_path)) == [plugins._pluginScanCacheFile]
+    assert plugins._readPluginScanCache('tag') is not None
+
+
+def test_pluginEntryPoints(monkeypatch):
+    from importlib.metadata import EntryPoint
+
+    entryMap = {'psychopy.visual': {
+        'Stim': EntryPoint(
+            name='Stim', value='plugmod.stims:Stim', group='psychopy.visual'),
+        'Nested': EntryPoint(
+            name='Nested', value='plugmod : Outer.Inner [extra]',
+            group='psychopy.visual'),
+        'stims': EntryPoint(
+            name='stims', value='plugmod.stims', group='psychopy.visual')}}
+    monkeypatch.setattr(plugins, '_installed_plugins_', {'psychopy-x': entryMap})
+
+    assert plugins.pluginEntryPoints('psychopy-x') is entryMap
+    assert plugins.pluginEntryPoints('psychopy-x', parse=True) == {
+        'psychopy.visual': {
+            'Stim': 'plugmod.stims.Stim',
+            'Nested': 'plugmod.Outer.Inner',
+            'stims': 'plugmod.stims'}}
+    assert plugins.pluginEntryPoints('psychopy-y') is None
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for loading plugin entry points lazily with psychopy.plugins.loadPlugin
+
+"""
+import sys
+import importlib.metadata
+import pytest
+
+import psychopy.tools as tools
+import psychopy.plugins as plugins
+
+
+@pytest.fixture
+def lazyPlugin(tmp_path, monkeypatch):
+    # a plugin module which hasn't been imported yet
+    (tmp_path / 'lazyplugmod.py').write_text(
+        "class LazyThing:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    entryMap = {'psychopy.tools': {
+        'LazyThing': importlib.metadata.EntryPoint(
+            name='LazyThing', value='lazyplugmod:LazyThing',
+            group='psychopy.tools'),
+        'BrokenThing': importlib.metadata.EntryPoint(
+            name='BrokenThing', value='lazyplugmod:NotDefined',
+            group='psychopy.tools')}}
+    monkeypatch.setattr(
+        plugins, '_installed_plugins_', {'psychopy-lazy': entryMap})
+    monkeypatch.setattr(plugins, '_loaded_plugins_', {})
+    monkeypatch.setattr(plugins, '_failed_plugins_', set())
+    monkeypatch.setattr(plugins, '_lazy_entry_points_', {})
+
+    # undo changes to the target module
+    hadGetattr = '__getattr__' in vars(tools)
+    prevGetattr = vars(tools).get('__getattr__')
+    yield 'psychopy-lazy'
+    for name in ('LazyThing', 'BrokenThing'):
+        vars(tools).pop(name, None)
+    if hadGetattr:
+        tools.__getattr__ = prevGetattr
+    else:
+        vars(tools).pop('__getattr__', None)
+    sys.modules.pop('lazyplugmod', None)
+
+
+def test_loadPluginLazy(lazyPlugin):
+    assert plugins.loadPlugin(lazyPlugin, lazy=True)
+    assert plugins.isPluginLoaded(lazyPlugin)
+
+    # nothing is imported until first use
+    assert 'lazyplugmod' not in sys.modules
+    assert 'LazyThing' not in vars(tools)
+
+    from lazyplugmod import LazyThing
+    assert tools.LazyThing is LazyThing
+    assert vars(tools)['LazyThing'] is LazyThing  # stored after loading
+
+    # errors are raised on first use, and the plugin is marked as failed
+    with pytest.raises(AttributeError):
+        tools.BrokenThing
+    assert lazyPlugin in plugins.listPlugins('failed')
+
+    # other names still raise as usual
+    with pytest.raises(AttributeError):
+        tools.notAnAttribute
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for psychopy.plugins.listPlugins
+
+"""
+import pytest
+
+import psychopy.plugins as plugins
+from psychopy.plugins import listPlugins
+
+
+@pytest.fixture
+def pluginState(monkeypatch):
+    monkeypatch.setattr(
+        plugins, '_installed_plugins_',
+        {'psychopy-a': {}, 'psychopy-b': {}, 'psychopy-c': {}})
+    monkeypatch.setattr(plugins, '_loaded_plugins_', {'psychopy-b': None})
+    monkeypatch.setattr(
+        plugins, '_failed_plugins_', {'psychopy-c', 'psychopy-a'})
+
+
+def test_listPlugins(pluginState):
+    assert listPlugins('all') == ['psychopy-a', 'psychopy-b', 'psychopy-c']
+    assert listPlugins('loaded') == ['psychopy-b']
+    assert listPlugins('unloaded') == ['psychopy-a', 'psychopy-c']
+    assert listPlugins('failed') == ['psychopy-a', 'psychopy-c']
+
+    # lists returned are copies
+    listPlugins('all').clear()
+    assert len(listPlugins('all')) == 3
+
+    with pytest.raises(ValueError):
+        listPlugins('notACategory')
+
+
+def test_requirePlugin(pluginState):
+    assert plugins.isPluginLoaded('psychopy-b')
+    assert not plugins.isPluginLoaded('psychopy-a')
+
+    plugins.requirePlugin('psychopy-b')
+    with pytest.raises(RuntimeError):
+        plugins.requirePlugin('psychopy-a')
+
+
+def test_startUpPlugins(pluginState, monkeypatch):
+    from psychopy.preferences import prefs
+
+    monkeypatch.setattr(plugins, 'scanPlugins', lambda: 3)
+    monkeypatch.setattr(prefs, 'saveUserPrefs', lambda: None)
+    monkeypatch.setitem(prefs.general, 'startUpPlugins', ['psychopy-a'])
+
+    plugins.startUpPlugins(['psychopy-b', 'psychopy-a', 'psychopy-b'])
+    assert plugins.listPlugins('startup') == ['psychopy-a', 'psychopy-b']
+    assert plugins.isStartUpPlugin('psychopy-b')
+
+    with pytest.raises(RuntimeError, match='`psychopy-x`, `psychopy-y`'):
+        plugins.startUpPlugins(['psychopy-x', 'psychopy-c', 'psychopy-y'])
+
+    plugins.startUpPlugins(['psychopy-c'], add=False)
+    assert plugins.listPlugins('startup') == ['psychopy-c']
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for tracking failed plugins in psychopy.plugins.loadPlugin
+
+"""
+import importlib.metadata
+import pytest
+
+import psychopy.tools as tools
+import psychopy.plugins as plugins
+
+
+def _entryMap(group):
+    return {group: {'loadPluginTestThing': importlib.metadata.EntryPoint(
+        name='loadPluginTestThing', value='psychopy.tools.mathtools:normalize',
+        group=group)}}
+
+
+@pytest.fixture
+def pluginState(monkeypatch):
+    monkeypatch.setattr(plugins, '_installed_plugins_', {})
+    monkeypatch.setattr(plugins, '_loaded_plugins_', {})
+    monkeypatch.setattr(plugins, '_failed_plugins_', set())
+    yield
+    vars(tools).pop('loadPluginTestThing', None)
+
+
+def test_loadPluginFailed(pluginState):
+    # entry point into a module that doesn't exist
+    plugins._installed_plugins_['psychopy-test'] = _entryMap(
+        'psychopy.tools.notAModuleName')
+    for _ in range(3):  # failing again doesn't add duplicates
+        assert not plugins.loadPlugin('psychopy-test')
+    assert plugins.listPlugins('failed') == ['psychopy-test']
+    assert not plugins.isPluginLoaded('psychopy-test')
+
+    # once fixed, the plugin is no longer listed as failed
+    plugins._installed_plugins_['psychopy-test'] = _entryMap('psychopy.tools')
+    assert plugins.loadPlugin('psychopy-test')
+    assert plugins.listPlugins('failed') == []
+    assert plugins.isPluginLoaded('psychopy-test')
+
+    from psychopy.tools.mathtools import normalize
+    assert tools.loadPluginTestThing is normalize
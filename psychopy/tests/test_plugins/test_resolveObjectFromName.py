@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for psychopy.plugins.resolveObjectFromName
+
+"""
+import sys
+import pytest
+
+import psychopy.tools as tools
+import psychopy.plugins as plugins
+from psychopy.plugins import resolveObjectFromName
+
+
+def test_resolveModule():
+    import psychopy.tools.mathtools as mathtools
+
+    assert resolveObjectFromName('psychopy.tools.mathtools') is mathtools
+    assert resolveObjectFromName('.mathtools', tools) is mathtools
+    assert resolveObjectFromName('.mathtools', 'psychopy.tools') is mathtools
+    # modules are remembered for later calls
+    assert plugins._resolved_modules_['psychopy.tools.mathtools'] is mathtools
+    assert resolveObjectFromName(
+        'psychopy.tools.mathtools', resolve=False) is mathtools
+
+
+def test_resolveObject():
+    from psychopy.tools.mathtools import lensCorrection
+
+    assert resolveObjectFromName(
+        'psychopy.tools.mathtools.lensCorrection') is lensCorrection
+    # only modules are remembered, other objects may be replaced by plugins
+    assert 'psychopy.tools.mathtools.lensCorrection' not in \
+        plugins._resolved_modules_
+
+
+def test_forgetResolvedName(monkeypatch):
+    import types
+    import psychopy.tools.mathtools as mathtools
+
+    monkeypatch.setattr(plugins, '_resolved_modules_', {})
+    assert resolveObjectFromName('psychopy.tools.mathtools') is mathtools
+
+    # a plugin replacing the module isn't hidden by the remembered one
+    replacement = types.ModuleType('psychopy.tools.mathtools')
+    monkeypatch.setattr(tools, 'mathtools', replacement)
+    plugins._forgetResolvedName('psychopy.tools.mathtools')
+    assert 'psychopy.tools.mathtools' not in plugins._resolved_modules_
+    assert resolveObjectFromName('psychopy.tools.mathtools') is replacement
+
+
+def test_resolveImports(monkeypatch):
+    # forget the module for this test only, it's restored afterwards
+    monkeypatch.delitem(sys.modules, 'psychopy.tools.stringtools', raising=False)
+    monkeypatch.setattr(plugins, '_resolved_modules_', {})
+    monkeypatch.delattr(tools, 'stringtools', raising=False)
+
+    assert resolveObjectFromName(
+        'psychopy.tools.stringtools', resolve=False, error=False) is None
+    with pytest.raises(NameError):
+        resolveObjectFromName('psychopy.tools.stringtools', resolve=False)
+
+    stringtools = resolveObjectFromName('psychopy.tools.stringtools')
+    assert stringtools is sys.modules['psychopy.tools.stringtools']
+
+
+def test_resolveErrors():
+    with pytest.raises(ValueError):
+        resolveObjectFromName('.mathtools')
+    with pytest.raises(ModuleNotFoundError):
+        resolveObjectFromName('notAModuleName.something')
+    with pytest.raises(NameError):
+        resolveObjectFromName('psychopy.tools.notAModuleName')
+    assert resolveObjectFromName(
+        'psychopy.tools.notAModuleName', error=False) is None
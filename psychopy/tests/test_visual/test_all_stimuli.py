@@ -1,4 +1,5 @@
-import sys, os, copy
+import sys, os
+import functools
 from pathlib import Path
 
 from psychopy import visual, monitors, prefs, constants
@@ -83,9 +84,64 @@ class Test_Window():
                 viewportOld, list(self.win.viewport))
 
 
+@functools.lru_cache(maxsize=None)
+def _getTestMonitor(distance=57.0):
+    """Get the test monitor at the given viewing distance (cm).
+
+    Monitors are only read from disk once and are shared by the window classes
+    which use them, so they must not be modified by tests.
+    """
+    mon = monitors.Monitor('testMonitor')
+    mon.setDistance(distance)
+    mon.setWidth(40.0)
+    mon.setSizePix([1024,768])
+
+    return mon
+
+
+# window kept open by `_getWindow`, keyed by the arguments it was made with
+_pooledWindow = {}
+
+
+def _getWindow(*args, units=None, **kwargs):
+    """Get a window for a test class.
+
+    The window of the previous class is reused if it was made with the same
+    arguments, apart from `units` which only sets the default units of new
+    stimuli. This avoids creating another OpenGL context, so classes sharing a
+    configuration should be kept next to each other. Otherwise the previous
+    window is closed, so only one window is open at a time.
+    """
+    key = repr((args, sorted(kwargs.items())))
+    win = _pooledWindow.pop(key, None)
+    for oldWin in _pooledWindow.values():
+        oldWin.close()
+    _pooledWindow.clear()
+
+    if win is None:
+        win = visual.Window(*args, units=units, **kwargs)
+    else:
+        win.units = units
+    _pooledWindow[key] = win
+
+    return win
+
+
+@pytest.fixture(scope='module', autouse=True)
+def closePooledWindow():
+    yield
+    for win in _pooledWindow.values():
+        win.close()
+    _pooledWindow.clear()
+
+
 class _baseVisualTest():
     #this class allows others to be created that inherit all the tests for
     #a different window config
+    #each subclass uses a single window (GL context) for all of its tests, so
+    #the subclasses can run in parallel processes with pytest-xdist using
+    #`pytest -n auto --dist loadscope` (not `loadfile`, which would keep every
+    #subclass in this file on the same worker)
     @classmethod
     def setup_class(self):#run once for each test class (window)
         self.win=None
@@ -94,11 +150,12 @@ class _baseVisualTest():
 
     @classmethod
     def teardown_class(self):#run once for each test class (window)
-        self.win.close()#shutil.rmtree(self.temp_dir)
+        pass  # windows are closed by `_getWindow` once no longer needed
 
     def setup_method(self):#this is run for each test individually
-        #make sure we start with a clean window
-        self.win.flip()
+        #make sure we start with a clean window, clearing the buffer drawn to
+        #rather than flipping avoids waiting for the screen refresh
+        self.win.clearBuffer()
 
     def test_imageAndGauss(self):
         win = self.win
@@ -380,9 +437,9 @@ class _baseVisualTest():
         "{}".format(dots) #check that str(xxx) is working
 
         #using .set() and check the underlying variable changed
-        prevDirs = copy.copy(dots._dotsDir)
-        prevSignals = copy.copy(dots._signalDots)
-        prevVerticesPix = copy.copy(dots.verticesPix)
+        prevDirs = dots._dotsDir.copy()
+        prevSignals = dots._signalDots.copy()
+        prevVerticesPix = dots.verticesPix.copy()
         dots.dir = 20
         dots.coherence = 0.5
         dots.fieldPos = [-0.5, 0.5]
@@ -391,11 +448,11 @@ class _baseVisualTest():
         dots.contrast = 0.8
         dots.draw()
         #check that things changed
-        assert (prevDirs-dots._dotsDir).sum()!=0, \
+        assert not numpy.array_equal(prevDirs, dots._dotsDir), \
             "dots._dotsDir failed to change after dots.setDir()"
-        assert prevSignals.sum()!=dots._signalDots.sum(), \
+        assert not numpy.array_equal(prevSignals, dots._signalDots), \
             "dots._signalDots failed to change after dots.setCoherence()"
-        assert not numpy.alltrue(prevVerticesPix==dots.verticesPix), \
+        assert not numpy.array_equal(prevVerticesPix, dots.verticesPix), \
             "dots.verticesPix failed to change after dots.setPos()"
 
     def test_element_array(self):
@@ -406,9 +463,8 @@ class _baseVisualTest():
         thetas = numpy.arange(0,360,10)
         N=len(thetas)
 
-        radii = numpy.linspace(0,1.0,N)*self.scaleFactor
-        x, y = pol2cart(theta=thetas, radius=radii)
-        xys = numpy.array([x,y]).transpose()
+        radii = numpy.linspace(0, self.scaleFactor, N)
+        xys = numpy.column_stack(pol2cart(theta=thetas, radius=radii))
         spiral = visual.ElementArrayStim(
                 win, opacities = 0, nElements=N, sizes=0.5*self.scaleFactor,
                 sfs=1.0, xys=xys, oris=-thetas)
@@ -481,7 +537,7 @@ class _baseVisualTest():
 class TestPygletNorm(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        self.win = visual.Window([128,128], winType='pyglet', pos=[50,50],
+        self.win = _getWindow([128,128], winType='pyglet', pos=[50,50],
                                  allowStencil=True, autoLog=False)
         self.contextName='norm'
         self.scaleFactor=1#applied to size/pos values
@@ -489,7 +545,7 @@ class TestPygletNorm(_baseVisualTest):
 class TestPygletHexColor(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        self.win = visual.Window([128,128], winType='pyglet', pos=[50,50],
+        self.win = _getWindow([128,128], winType='pyglet', pos=[50,50],
                                  color="#FF0099",
                                  allowStencil=True, autoLog=False)
         self.contextName='normHexbackground'
@@ -499,7 +555,7 @@ if not systemtools.isVM_CI():
     class TestPygletBlendAdd(_baseVisualTest):
         @classmethod
         def setup_class(self):
-            self.win = visual.Window([128,128], winType='pyglet', pos=[50,50],
+            self.win = _getWindow([128,128], winType='pyglet', pos=[50,50],
                                      blendMode='add', useFBO=True)
             self.contextName='normAddBlend'
             self.scaleFactor=1#applied to size/pos values
@@ -508,7 +564,7 @@ if not systemtools.isVM_CI():
 class TestPygletNormFBO(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        self.win = visual.Window([128,128], units="norm", winType='pyglet', pos=[50,50],
+        self.win = _getWindow([128,128], units="norm", winType='pyglet', pos=[50,50],
                                  allowStencil=True, autoLog=False, useFBO=True)
         self.contextName='norm'
         self.scaleFactor=1#applied to size/pos values
@@ -517,7 +573,7 @@ class TestPygletNormFBO(_baseVisualTest):
 class TestPygletHeight(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        self.win = visual.Window([128,64], units="height", winType='pyglet', pos=[50,50],
+        self.win = _getWindow([128,64], units="height", winType='pyglet', pos=[50,50],
                                  allowStencil=False, autoLog=False)
         self.contextName='height'
         self.scaleFactor=1#applied to size/pos values
@@ -526,7 +582,7 @@ class TestPygletHeight(_baseVisualTest):
 class TestPygletNormStencil(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        self.win = visual.Window([128,128], units="norm", monitor='testMonitor',
+        self.win = _getWindow([128,128], units="norm", monitor='testMonitor',
                                  winType='pyglet', pos=[50,50],
                                  allowStencil=True, autoLog=False)
         self.contextName='stencil'
@@ -536,53 +592,42 @@ class TestPygletNormStencil(_baseVisualTest):
 class TestPygletPix(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        mon = monitors.Monitor('testMonitor')
-        mon.setDistance(57)
-        mon.setWidth(40.0)
-        mon.setSizePix([1024,768])
-        self.win = visual.Window([128,128], units="pix", monitor=mon,
+        mon = _getTestMonitor()
+        self.win = _getWindow([128,128], units="pix", monitor=mon,
                                  winType='pyglet', pos=[50, 50],
                                  allowStencil=True, autoLog=False)
         self.contextName='pix'
         self.scaleFactor=60#applied to size/pos values
 
 
-class TestPygletCm(_baseVisualTest):
+class TestPygletDeg(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        mon = monitors.Monitor('testMonitor')
-        mon.setDistance(57.0)
-        mon.setWidth(40.0)
-        mon.setSizePix([1024,768])
-        self.win = visual.Window([128,128], units="cm", monitor=mon,
-                                 winType='pyglet', pos=[50,50],
-                                 allowStencil=False, autoLog=False)
-        self.contextName='cm'
+        mon = _getTestMonitor()
+        self.win = _getWindow([128,128], units="deg", monitor=mon,
+                                 winType='pyglet', pos=[50,50], allowStencil=True,
+                                 autoLog=False)
+        self.contextName='deg'
         self.scaleFactor=2#applied to size/pos values
 
 
-class TestPygletDeg(_baseVisualTest):
+class TestPygletCm(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        mon = monitors.Monitor('testMonitor')
-        mon.setDistance(57.0)
-        mon.setWidth(40.0)
-        mon.setSizePix([1024,768])
-        self.win = visual.Window([128,128], units="deg", monitor=mon,
-                                 winType='pyglet', pos=[50,50], allowStencil=True,
-                                 autoLog=False)
-        self.contextName='deg'
+        mon = _getTestMonitor()
+        self.win = _getWindow([128,128], units="cm", monitor=mon,
+                                 winType='pyglet', pos=[50,50],
+                                 allowStencil=False, autoLog=False)
+        self.contextName='cm'
         self.scaleFactor=2#applied to size/pos values
 
 
 class TestPygletDegFlat(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        mon = monitors.Monitor('testMonitor')
-        mon.setDistance(10.0) #exaggerate the effect of flatness by setting the monitor close
-        mon.setWidth(40.0)
-        mon.setSizePix([1024,768])
-        self.win = visual.Window([128,128], units="degFlat", monitor=mon,
+        #exaggerate the effect of flatness by setting the monitor close
+        mon = _getTestMonitor(distance=10.0)
+        self.win = _getWindow([128,128], units="degFlat", monitor=mon,
                                  winType='pyglet', pos=[50,50],
                                  allowStencil=True, autoLog=False)
         self.contextName='degFlat'
@@ -592,11 +637,9 @@ class TestPygletDegFlat(_baseVisualTest):
 class TestPygletDegFlatPos(_baseVisualTest):
     @classmethod
     def setup_class(self):
-        mon = monitors.Monitor('testMonitor')
-        mon.setDistance(10.0) #exaggerate the effect of flatness by setting the monitor close
-        mon.setWidth(40.0)
-        mon.setSizePix([1024,768])
-        self.win = visual.Window([128,128], units='degFlatPos', monitor=mon,
+        #exaggerate the effect of flatness by setting the monitor close
+        mon = _getTestMonitor(distance=10.0)
+        self.win = _getWindow([128,128], units='degFlatPos', monitor=mon,
                                  winType='pyglet', pos=[50,50],
                                  allowStencil=True, autoLog=False)
         self.contextName='degFlatPos'
@@ -10,14 +10,11 @@ class Test_Custommouse():
     @classmethod
     def setup_class(self):
         self.win = Window([128,256])
-        self.winpix = Window([128,256], units='pix', autoLog=False)
     @classmethod
     def teardown_class(self):
-        for win in [self.win, self.winpix]:
-            win.close()
+        self.win.close()
 
     def test_init(self):
-        #for win in [self.win, self.winpix]:
         m = CustomMouse(self.win, showLimitBox=True, autoLog=False)
         assert (m.leftLimit, m.topLimit, m.rightLimit, m.bottomLimit) == (-1, 1, 0.99, -0.98)
         assert m.visible == True
@@ -36,11 +33,18 @@ class Test_Custommouse():
             m.setPointer('a')
         m.setPointer(TextStim(self.win, text='x'))
 
-        m = CustomMouse(self.winpix, autoLog=False)
-        assert (m.leftLimit, m.topLimit, m.rightLimit, m.bottomLimit) == (-64.0, 128.0, 59.0, -118.0)
-        assert m.visible == True
-        assert m.showLimitBox == m.clickOnUp == False
-        m.getPos()
+        # default limits in pix units only depend on the window size, so
+        # switch units rather than opening a second window
+        units = self.win.units
+        self.win.units = 'pix'
+        try:
+            m = CustomMouse(self.win, autoLog=False)
+            assert (m.leftLimit, m.topLimit, m.rightLimit, m.bottomLimit) == (-64.0, 128.0, 59.0, -118.0)
+            assert m.visible == True
+            assert m.showLimitBox == m.clickOnUp == False
+            m.getPos()
+        finally:
+            self.win.units = units
 
     def test_limits(self):
         # to-do: test setLimit
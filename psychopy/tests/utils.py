@@ -1,4 +1,5 @@
 import sys
+import functools
 from os.path import abspath, basename, dirname, isfile, isdir, join as pjoin
 import os.path
 from pathlib import Path
@@ -65,6 +66,39 @@ def getFailFilenames(fileName, tag=""):
     return localFileName, exemplarFileName
 
 
+def _imageData(img):
+    """Get the pixel data of an image as an array, one row per pixel.
+
+    This matches the layout of ``np.array(img.getdata())`` but is read from the
+    image buffer directly, rather than through a Python sequence. Values are
+    signed so differences between images don't wrap around.
+    """
+    imgDat = np.asarray(img, dtype=np.int16).reshape(img.width * img.height, -1)
+
+    return imgDat if imgDat.shape[1] > 1 else imgDat.reshape(-1)
+
+
+@functools.lru_cache(maxsize=64)
+def _loadScreenshot(fileName):
+    """Load the size and pixel data of a reference screenshot.
+
+    Decoded images are cached, as the same screenshots are compared against by
+    each window configuration. The returned array is read-only since it is
+    shared between calls.
+    """
+    with Image.open(fileName) as expected:
+        expDat = _imageData(expected)
+        expDat.flags.writeable = False
+
+        return expected.size, expDat
+
+
+def _saveFailedScreenshot(frame, fileName, localFileName, exemplarFileName):
+    """Save a failed screenshot and the exemplar it was compared against."""
+    frame.save(localFileName, optimize=1)
+    shutil.copyfile(fileName, exemplarFileName)
+
+
 def compareScreenshot(fileName, win, tag="", crit=5.0):
     """Compare the current back buffer of the given window with the file
 
@@ -85,13 +119,12 @@ def compareScreenshot(fileName, win, tag="", crit=5.0):
         frame.save(fileName, optimize=1)
         pytest.skip("Created %s" % basename(fileName))
     else:
-        expected = Image.open(fileName)
-        expDat = np.array(expected.getdata())
-        imgDat = np.array(frame.getdata())
+        expSize, expDat = _loadScreenshot(fileName)
+        imgDat = _imageData(frame)
         # for retina displays the frame data is 4x bigger than expected
         if win.useRetina and imgDat.shape[0] == expDat.shape[0]*4:
-            frame = frame.resize(expected.size, resample=Image.LANCZOS)
-            imgDat = np.array(frame.getdata())
+            frame = frame.resize(expSize, resample=Image.LANCZOS)
+            imgDat = _imageData(frame)
             crit += 5  # be more relaxed because of the interpolation
         rms = np.std(imgDat-expDat)
         localFileName, exemplarFileName = getFailFilenames(fileName, tag=tag)
@@ -101,8 +134,8 @@ def compareScreenshot(fileName, win, tag="", crit=5.0):
                   % (rms, crit))
         if not rms<crit: #don't do `if rms>=crit because that doesn't catch rms=nan
             # If test fails, save local copy and copy of exemplar to fails folder
-            frame.save(localFileName, optimize=1)
-            expected.save(exemplarFileName, optimize=1)
+            _saveFailedScreenshot(
+                frame, fileName, localFileName, exemplarFileName)
             logging.warning('PsychoPyTests: Saving local copy into %s' % localFileName)
         assert rms<crit, \
             "RMS=%.3g at threshold=%.3g. Local copy in %s" % (rms, crit, localFileName)
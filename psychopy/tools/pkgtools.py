@@ -27,13 +27,19 @@ from psychopy.preferences import prefs
 from psychopy.localization import _translate
 import psychopy.logging as logging
 import importlib
-import pkg_resources
 import sys
 import os
 import os.path
-import requests
 import shutil
 import site
+from psychopy.contrib.lazy_import import lazy_import
+
+# lazy_import puts these into the namespace but delays import until needed,
+# importing `pkg_resources` scans every installed package which is slow
+lazy_import(globals(), """
+import pkg_resources
+import requests
+""")
 
 # On import we want to configure the user site-packages dir and add it to the
 # import path. 
@@ -60,7 +66,7 @@ if not site.USER_SITE in sys.path:
 
 # cache list of packages to speed up checks
 _installedPackageCache = []
-_installedPackageNamesCache = []
+_installedPackageNamesCache = set()
 
 
 class PluginStub:
@@ -122,15 +128,17 @@ def refreshPackages():
     _installedPackageCache.clear()
     _installedPackageNamesCache.clear()
 
+    global pkg_resources
+    import pkg_resources  # make sure we reload the module, not the lazy proxy
     importlib.reload(pkg_resources)  # reload since package paths might be stale
 
     # this is like calling `pip freeze` and parsing the output, but faster!
+    # The working set already holds the distributions, no need to look each
+    # one up again with `get_distribution`.
     for pkg in pkg_resources.working_set:
-        thisPkg = pkg_resources.get_distribution(pkg.key)
-        _installedPackageCache.append(
-            (thisPkg.project_name, thisPkg.version))
-        _installedPackageNamesCache.append(pkg_resources.safe_name(
-            thisPkg.project_name))  # names only
+        _installedPackageCache.append((pkg.project_name, pkg.version))
+        _installedPackageNamesCache.add(
+            pkg_resources.safe_name(pkg.project_name))  # names only
 
 
 def getUserPackagesPath():
@@ -557,9 +565,7 @@ def getInstalledPackages():
     # this is like calling `pip freeze` and parsing the output, but faster!
     installedPackages = []
     for pkg in pkg_resources.working_set:
-        thisPkg = pkg_resources.get_distribution(pkg.key)
-        installedPackages.append(
-            (thisPkg.project_name, thisPkg.version))
+        installedPackages.append((pkg.project_name, pkg.version))
 
     return installedPackages
 
@@ -601,12 +607,9 @@ def getPackageMetadata(packageName):
 
     metadata = dist.get_metadata(dist.PKG_INFO)
 
-    # parse the metadata using
-    metadict = dict()
-    for key, val in email.message_from_string(metadata).raw_items():
-        metadict[key] = val
-
-    return metadict
+    # parse only the header fields, the description body (which can be long)
+    # is left unparsed
+    return dict(email.parser.HeaderParser().parsestr(metadata).raw_items())
 
 
 def getPypiInfo(packageName, silence=False):
@@ -11,13 +11,12 @@ import os
 import sys
 import re
 import subprocess  # for git commandline invocation
-from collections import OrderedDict
 from subprocess import CalledProcessError
 import psychopy  # for currently loaded version
 from psychopy import prefs
 # the following will all have been imported so import here and reload later
 from psychopy import logging, tools, web, constants, preferences, __version__
-from pkg_resources import parse_version
+from packaging.version import parse as parse_version
 from importlib import reload
 from packaging.version import Version, InvalidVersion, VERSION_PATTERN
 
@@ -30,16 +29,16 @@ _localVersionsCache = []
 _remoteVersionsCache = []
 
 # define ranges of PsychoPy versions which support each Python version
-versionMap = OrderedDict({
+versionMap = {
     Version('2.7'): (Version("0.0"), Version("2020.2.0")),
     Version('3.6'): (Version("1.9"), Version("2022.1.0")),
     Version('3.8'): (Version("2022.1.0"), None),
     Version('3.10'): (Version("2023.2.0"), None),
-})
+}
 # fill out intermediate versions
 for n in range(13):
     v = Version(f"3.{n}")
-    av = max([key for key in versionMap if key <= v])
+    av = max(key for key in versionMap if key <= v)
     versionMap[v] = versionMap[av]
 # parse current psychopy version
 psychopyVersion = Version(__version__)